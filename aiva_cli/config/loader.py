@@ -90,6 +90,8 @@ class AIVASettings(BaseModel):
     debug: bool = Field(default=False)
     max_retries: int = Field(default=3, ge=0)
     concurrent_tasks: int = Field(default=2, ge=1, le=10)
+    circuit_breaker_threshold: int = Field(default=5, ge=1, description="Consecutive failed calls before the model circuit opens")
+    circuit_breaker_cooldown: float = Field(default=30.0, ge=0.0, description="Seconds a tripped model circuit stays open")
     
     @field_validator('gemini_api_key') # Updated decorator
     @classmethod # Added classmethod decorator as per Pydantic V2 style for field_validator
@@ -175,17 +177,20 @@ class ConfigLoader:
             'OUTPUT_IMAGE_FORMAT': 'output.image_format',
             'DEBUG': 'debug',
             'MAX_RETRIES': 'max_retries',
-            'CONCURRENT_TASKS': 'concurrent_tasks'
+            'CONCURRENT_TASKS': 'concurrent_tasks',
+            'CIRCUIT_BREAKER_THRESHOLD': 'circuit_breaker_threshold',
+            'CIRCUIT_BREAKER_COOLDOWN': 'circuit_breaker_cooldown'
         }
         
         for env_key, config_key in env_mapping.items():
             value = os.getenv(env_key)
             if value is not None:
                 # Convert string values to appropriate types
-                if env_key in ['MODEL_TEMPERATURE']:
+                if env_key in ['MODEL_TEMPERATURE', 'CIRCUIT_BREAKER_COOLDOWN']:
                     value = float(value)
                 elif env_key in ['MODEL_MAX_TOKENS', 'MODEL_TIMEOUT', 'SCRIPT_LENGTH', 
-                               'SEGMENT_DURATION', 'TOTAL_DURATION', 'MAX_RETRIES', 'CONCURRENT_TASKS']:
+                               'SEGMENT_DURATION', 'TOTAL_DURATION', 'MAX_RETRIES', 'CONCURRENT_TASKS',
+                               'CIRCUIT_BREAKER_THRESHOLD']:
                     value = int(value)
                 elif env_key in ['LOG_FILE_ENABLED', 'LOG_CONSOLE_ENABLED', 
                                'OUTPUT_CREATE_MANIFEST', 'DEBUG']:
@@ -0,0 +1,119 @@
+"""Shared fixtures for the crew configuration tests.
+
+Agents and the default crew are built once per session and handed to
+each test as a deep copy, so constructor work (segmenter, prompt
+enhancer and image model setup) is not repeated for every test and no
+test can change state another test sees. Image rendering goes through
+a placeholder model so no test reaches the API.
+
+The crew modules are imported inside the fixtures, so a package that
+fails to import skips the crew tests instead of aborting the session.
+"""
+
+import copy
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+
+class _PlaceholderImageModel:
+    """Deterministic stand-in for GeminiImageModel that never touches the network."""
+    
+    def generate_image(self, prompt, output_path, **kwargs):
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(b"\0")
+        return output_path
+
+
+@pytest.fixture(scope="session")
+def _agents_module():
+    """The crew agents module, or a skip if the package cannot be imported."""
+    return pytest.importorskip("aiva_cli.crew_config.agents")
+
+
+@pytest.fixture(scope="session")
+def _crew_module():
+    """The crew orchestrator module, or a skip if the package cannot be imported."""
+    return pytest.importorskip("aiva_cli.crew_config.crew")
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _mock_image_backend(_agents_module):
+    """Route every ImageRenderAgent through the placeholder image model."""
+    with patch.object(_agents_module, "GeminiImageModel", _PlaceholderImageModel), \
+         patch.object(_agents_module, "_image_model_available", True):
+        yield
+
+
+@pytest.fixture(scope="session")
+def _script_agent_template(_agents_module):
+    """Session-wide ScriptAgent instance."""
+    return _agents_module.ScriptAgent()
+
+
+@pytest.fixture(scope="session")
+def _segmenter_agent_template(_agents_module):
+    """Session-wide SegmenterAgent instance."""
+    return _agents_module.SegmenterAgent()
+
+
+@pytest.fixture(scope="session")
+def _prompt_gen_agent_template(_agents_module):
+    """Session-wide PromptGenAgent instance."""
+    return _agents_module.PromptGenAgent()
+
+
+@pytest.fixture(scope="session")
+def _image_render_agent_template(_agents_module):
+    """Session-wide ImageRenderAgent instance."""
+    return _agents_module.ImageRenderAgent()
+
+
+@pytest.fixture(scope="session")
+def agent_registry(_agents_module):
+    """Session-wide mapping of every registered agent name to an instance.
+    
+    Tests must treat these instances as read-only.
+    """
+    return {
+        name: _agents_module.get_agent(name)
+        for name in _agents_module.list_available_agents()
+    }
+
+
+@pytest.fixture(scope="session")
+def _default_crew_template(_crew_module):
+    """Session-wide AivaCrew built with the default config."""
+    return _crew_module.AivaCrew()
+
+
+@pytest.fixture
+def script_agent(_script_agent_template):
+    """Per-test deep copy of the cached ScriptAgent."""
+    return copy.deepcopy(_script_agent_template)
+
+
+@pytest.fixture
+def segmenter_agent(_segmenter_agent_template):
+    """Per-test deep copy of the cached SegmenterAgent."""
+    return copy.deepcopy(_segmenter_agent_template)
+
+
+@pytest.fixture
+def prompt_gen_agent(_prompt_gen_agent_template):
+    """Per-test deep copy of the cached PromptGenAgent."""
+    return copy.deepcopy(_prompt_gen_agent_template)
+
+
+@pytest.fixture
+def image_render_agent(_image_render_agent_template):
+    """Per-test deep copy of the cached ImageRenderAgent."""
+    return copy.deepcopy(_image_render_agent_template)
+
+
+@pytest.fixture
+def default_crew(_default_crew_template):
+    """Per-test deep copy of the cached default crew."""
+    return copy.deepcopy(_default_crew_template)
@@ -21,6 +21,12 @@ from dataclasses import dataclass, asdict
 from datetime import datetime
 from enum import Enum
 
+# orjson is optional; state checkpoints fall back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import AIVA components
 from ..crew_config.agents import get_agent, AgentResult, AgentStatus
 from ..crew_config.crew import AivaCrew, WorkflowConfig
@@ -318,7 +324,8 @@ class ContentPipeline:
             image_size=config_dict.get('image_size', '1024x1024'),
             enable_parallel=config_dict.get('enable_parallel', False),
             max_retries=config_dict.get('max_retries', 3),
-            timeout_seconds=config_dict.get('timeout_seconds', 300)
+            timeout_seconds=config_dict.get('timeout_seconds', 300),
+            strict=True
         )
     
     def _generate_full_transcript(self, topic: str, video_type: str) -> str:
@@ -815,13 +822,22 @@ Please generate only the script content without any formatting markers or stage
         """Save current pipeline state to file."""
         if self.state:
             self.state.updated_at = datetime.now().isoformat()
-            with open(state_file, 'w') as f:
-                json.dump(asdict(self.state), f, indent=2, default=str)
+            state_data = asdict(self.state)
+            if orjson is not None:
+                Path(state_file).write_bytes(
+                    orjson.dumps(state_data, default=_json_default, option=orjson.OPT_INDENT_2)
+                )
+            else:
+                with open(state_file, 'w') as f:
+                    json.dump(state_data, f, indent=2, default=_json_default)
     
     def _load_state(self, state_file: Path) -> PipelineState:
         """Load pipeline state from file."""
-        with open(state_file, 'r') as f:
-            data = json.load(f)
+        if orjson is not None:
+            data = orjson.loads(Path(state_file).read_bytes())
+        else:
+            with open(state_file, 'r') as f:
+                data = json.load(f)
         
         # Convert segments back to SegmentState objects
         segments = {}
@@ -867,6 +883,13 @@ Please generate only the script content without any formatting markers or stage
                 })
 
 
+def _json_default(obj: Any) -> Any:
+    """Serialize enums by value and anything else as a string."""
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+
 # Convenience function for direct pipeline execution
 def generate_content(topic: str, 
                     video_type: str, 
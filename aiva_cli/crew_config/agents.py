@@ -6,6 +6,8 @@ prompt generation, and image rendering.
 """
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
@@ -401,39 +403,37 @@ class ImageRenderAgent(BaseAgent):
             enhanced_prompts = input_data.get("enhanced_prompts", [])
             output_dir = kwargs.get("output_dir", "./generated_images")
             image_size = kwargs.get("image_size", "1024x1024")
+            max_parallel = kwargs.get("max_parallel", 1)
             
             self.logger.info(f"Generating {len(enhanced_prompts)} images")
             
             if not self.validate_input(enhanced_prompts):
                 raise ValueError("Invalid prompts input for image generation")
             
-            # Generate images
-            generated_images = []
-            for i, prompt_data in enumerate(enhanced_prompts):
-                try:
-                    # Extract prompt
-                    prompt = prompt_data.get("enhanced_prompt", "")
-                    
-                    # Generate image using the AI model
-                    image_result = self._generate_image(prompt, image_size, i + 1, output_dir)
-                    
-                    generated_images.append({
-                        "segment_index": prompt_data.get("segment_index", i + 1),
-                        "prompt": prompt,
-                        "image_path": image_result.get("path"),
-                        "image_size": image_size,
-                        "generation_time": image_result.get("generation_time", 0),
-                        "success": True
-                    })
-                    
-                except Exception as e:
-                    self.logger.warning(f"Failed to generate image for segment {i+1}: {e}")
-                    generated_images.append({
-                        "segment_index": prompt_data.get("segment_index", i + 1),
-                        "prompt": prompt_data.get("enhanced_prompt", ""),
-                        "error": str(e),
-                        "success": False
-                    })
+            # Give each image its own segment directory when rendering a batch
+            # so concurrent renders never write to the same file
+            if len(enhanced_prompts) > 1:
+                output_dirs = [
+                    os.path.join(output_dir, f"segment_{i + 1:02d}")
+                    for i in range(len(enhanced_prompts))
+                ]
+            else:
+                output_dirs = [output_dir]
+            
+            # Generate images, fanning out over a thread pool since each
+            # render is dominated by the API round-trip
+            indices = range(len(enhanced_prompts))
+            if max_parallel > 1 and len(enhanced_prompts) > 1:
+                with ThreadPoolExecutor(max_workers=min(max_parallel, len(enhanced_prompts))) as executor:
+                    generated_images = list(executor.map(
+                        lambda i: self._render_one(i, enhanced_prompts[i], image_size, output_dirs[i]),
+                        indices
+                    ))
+            else:
+                generated_images = [
+                    self._render_one(i, enhanced_prompts[i], image_size, output_dirs[i])
+                    for i in indices
+                ]
             
             self.status = AgentStatus.COMPLETED
             return AgentResult(
@@ -461,6 +461,33 @@ class ImageRenderAgent(BaseAgent):
                 error=str(e)
             )
     
+    def _render_one(self, i: int, prompt_data: Dict[str, Any], image_size: str, output_dir: str) -> Dict[str, Any]:
+        """Render a single prompt and describe the outcome for the result data."""
+        try:
+            # Extract prompt
+            prompt = prompt_data.get("enhanced_prompt", "")
+            
+            # Generate image using the AI model
+            image_result = self._generate_image(prompt, image_size, i + 1, output_dir)
+            
+            return {
+                "segment_index": prompt_data.get("segment_index", i + 1),
+                "prompt": prompt,
+                "image_path": image_result.get("path"),
+                "image_size": image_size,
+                "generation_time": image_result.get("generation_time", 0),
+                "success": True
+            }
+            
+        except Exception as e:
+            self.logger.warning(f"Failed to generate image for segment {i+1}: {e}")
+            return {
+                "segment_index": prompt_data.get("segment_index", i + 1),
+                "prompt": prompt_data.get("enhanced_prompt", ""),
+                "error": str(e),
+                "success": False
+            }
+    
     def _generate_image(self, prompt: str, size: str, index: int, output_dir: str = "./generated_images") -> Dict[str, Any]:
         """Generate image from prompt using the image model."""
         import time
@@ -5,9 +5,12 @@ in the AIVA video generation pipeline. It manages the sequential workflow,
 dependency resolution, progress tracking, and error handling.
 """
 
+import io
 import logging
+import sys
 import time
-from typing import Dict, List, Any, Optional, Callable
+from collections import deque
+from typing import Dict, List, Any, Optional, Callable, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -29,6 +32,10 @@ class WorkflowStatus(Enum):
     CANCELLED = "cancelled"
 
 
+class CycleDetectedError(ValueError):
+    """Raised when the agent dependency graph contains a cycle."""
+
+
 @dataclass
 class WorkflowConfig:
     """Configuration for workflow execution."""
@@ -38,8 +45,29 @@ class WorkflowConfig:
     output_dir: str = "./output"
     image_size: str = "1024x1024"
     enable_parallel: bool = False
+    max_parallel: int = 4
     max_retries: int = 3
     timeout_seconds: int = 300
+    strict: bool = False
+    
+    def __post_init__(self):
+        """Fail fast on invalid strict configs, before any crew or agent is built."""
+        if self.strict:
+            issues = self.validate()
+            if issues:
+                raise ValueError("Workflow validation failed: " + "; ".join(issues))
+    
+    def validate(self) -> List[str]:
+        """Check the current field values and return any issues found."""
+        issues = []
+        
+        if self.target_segments <= 0:
+            issues.append("target_segments must be positive")
+        
+        if self.target_duration <= 0:
+            issues.append("target_duration must be positive")
+        
+        return issues
     
 
 @dataclass
@@ -96,44 +124,67 @@ class ProgressCallback:
 
 
 class ConsoleProgressCallback(ProgressCallback):
-    """Console-based progress callback."""
+    """Console-based progress callback.
     
-    def __init__(self, verbose: bool = True):
+    With ``buffer=True`` messages are collected in memory and written to
+    stdout in one go when the workflow completes, instead of one write per
+    event.
+    """
+    
+    def __init__(self, verbose: bool = True, buffer: bool = False):
         self.verbose = verbose
+        self.buffer = buffer
         self.logger = logging.getLogger("aiva.crew.progress")
+        self._buf = io.StringIO()
+    
+    def _emit(self, message: str):
+        """Write a message now, or queue it until the workflow completes."""
+        if self.buffer:
+            self._buf.write(message + "\n")
+        else:
+            print(message)
+    
+    def flush(self):
+        """Write any buffered messages to stdout."""
+        output = self._buf.getvalue()
+        if output:
+            sys.stdout.write(output)
+            sys.stdout.flush()
+            self._buf = io.StringIO()
     
     def on_workflow_start(self, config: WorkflowConfig):
         if self.verbose:
-            print(f"🚀 Starting AIVA workflow with {config.target_segments} segments")
-            print(f"   Style: {config.style_preset.value}")
-            print(f"   Output: {config.output_dir}")
+            self._emit(f"🚀 Starting AIVA workflow with {config.target_segments} segments")
+            self._emit(f"   Style: {config.style_preset.value}")
+            self._emit(f"   Output: {config.output_dir}")
     
     def on_agent_start(self, agent_name: str, agent: BaseAgent):
         if self.verbose:
-            print(f"🤖 {agent_name}: {agent.role}")
-            print(f"   Goal: {agent.goal}")
+            self._emit(f"🤖 {agent_name}: {agent.role}")
+            self._emit(f"   Goal: {agent.goal}")
     
     def on_agent_complete(self, agent_name: str, result: AgentResult):
         if result.status == AgentStatus.COMPLETED:
             if self.verbose:
-                print(f"✅ {agent_name}: Completed successfully")
+                self._emit(f"✅ {agent_name}: Completed successfully")
                 if result.metadata:
                     for key, value in result.metadata.items():
-                        print(f"   {key}: {value}")
+                        self._emit(f"   {key}: {value}")
         else:
-            print(f"❌ {agent_name}: Failed - {result.error}")
+            self._emit(f"❌ {agent_name}: Failed - {result.error}")
     
     def on_agent_error(self, agent_name: str, error: str):
-        print(f"💥 {agent_name}: Error - {error}")
+        self._emit(f"💥 {agent_name}: Error - {error}")
     
     def on_workflow_complete(self, result: WorkflowResult):
         if result.status == WorkflowStatus.COMPLETED:
-            print(f"🎉 Workflow completed in {result.execution_time:.2f}s")
+            self._emit(f"🎉 Workflow completed in {result.execution_time:.2f}s")
             final_output = result.get_final_output()
             if final_output:
-                print(f"📊 Generated {final_output.get('image_count', 0)} images")
+                self._emit(f"📊 Generated {final_output.get('image_count', 0)} images")
         else:
-            print(f"💔 Workflow failed: {result.error}")
+            self._emit(f"💔 Workflow failed: {result.error}")
+        self.flush()
 
 
 class AivaCrew:
@@ -144,7 +195,10 @@ class AivaCrew:
         self.logger = logging.getLogger("aiva.crew")
         self.agents = self._initialize_agents()
         self.workflow_graph = self._build_workflow_graph()
+        # The graph is fixed after init, so resolve the order once
+        self._execution_order = self._topo_sort()
         self.callbacks: List[ProgressCallback] = []
+        self._callbacks_set: set = set()
         
     def _initialize_agents(self) -> Dict[str, BaseAgent]:
         """Initialize all required agents."""
@@ -174,14 +228,21 @@ class AivaCrew:
         }
     
     def add_callback(self, callback: ProgressCallback):
-        """Add progress callback."""
-        self.callbacks.append(callback)
+        """Add progress callback (adding the same callback twice is a no-op)."""
+        if callback not in self._callbacks_set:
+            self.callbacks.append(callback)
+            self._callbacks_set.add(callback)
     
     def remove_callback(self, callback: ProgressCallback):
         """Remove progress callback."""
-        if callback in self.callbacks:
+        if callback in self._callbacks_set:
+            self._callbacks_set.discard(callback)
             self.callbacks.remove(callback)
     
+    def has_callback(self, callback: ProgressCallback) -> bool:
+        """Check whether a progress callback is registered."""
+        return callback in self._callbacks_set
+    
     def _notify_workflow_start(self):
         """Notify callbacks of workflow start."""
         for callback in self.callbacks:
@@ -222,10 +283,41 @@ class AivaCrew:
             except Exception as e:
                 self.logger.warning(f"Callback error on workflow complete: {e}")
     
-    def _get_execution_order(self) -> List[str]:
+    def _topo_sort(self) -> Tuple[str, ...]:
+        """Topologically sort the workflow graph with Kahn's algorithm.
+        
+        Agents that become ready at the same time keep their graph insertion
+        order, so the result is deterministic.
+        
+        Raises:
+            CycleDetectedError: If the dependencies contain a cycle
+        """
+        indegree = {name: len(deps) for name, deps in self.workflow_graph.items()}
+        dependents: Dict[str, List[str]] = {name: [] for name in self.workflow_graph}
+        for name, deps in self.workflow_graph.items():
+            for dep in deps:
+                dependents.setdefault(dep, []).append(name)
+        
+        ready = deque(name for name, degree in indegree.items() if degree == 0)
+        order: List[str] = []
+        
+        while ready:
+            name = ready.popleft()
+            order.append(name)
+            for dependent in dependents[name]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    ready.append(dependent)
+        
+        if len(order) < len(indegree):
+            remaining = [name for name in indegree if name not in order]
+            raise CycleDetectedError(f"Circular dependency between agents: {remaining}")
+        
+        return tuple(order)
+    
+    def _get_execution_order(self) -> Tuple[str, ...]:
         """Get agent execution order based on dependencies."""
-        # Simple topological sort for our linear pipeline
-        return ["script", "segmenter", "prompt_gen", "image_render"]
+        return self._execution_order
     
     def _prepare_agent_input(self, agent_name: str, previous_results: Dict[str, AgentResult]) -> Any:
         """Prepare input data for agent based on previous results."""
@@ -261,7 +353,8 @@ class AivaCrew:
         elif agent_name == "image_render":
             kwargs.update({
                 "output_dir": self.config.output_dir,
-                "image_size": self.config.image_size
+                "image_size": self.config.image_size,
+                "max_parallel": self.config.max_parallel if self.config.enable_parallel else 1
             })
         
         return kwargs
@@ -406,11 +499,7 @@ class AivaCrew:
                     issues.append(f"Agent {agent_name} depends on missing agent {dep}")
         
         # Check configuration
-        if self.config.target_segments <= 0:
-            issues.append("target_segments must be positive")
-        
-        if self.config.target_duration <= 0:
-            issues.append("target_duration must be positive")
+        issues.extend(self.config.validate())
         
         # Check output directory
         try:
@@ -431,6 +520,12 @@ def run_workflow(script_content: str,
                 config: Optional[WorkflowConfig] = None,
                 verbose: bool = True) -> WorkflowResult:
     """Run the complete AIVA workflow with a script."""
+    # Reject a bad config before paying for agent initialization
+    if config is not None:
+        config_issues = config.validate()
+        if config_issues:
+            raise ValueError("Workflow validation failed: " + "; ".join(config_issues))
+    
     crew = create_crew(config)
     
     # Add console callback if verbose
@@ -440,7 +535,7 @@ def run_workflow(script_content: str,
     # Validate workflow
     issues = crew.validate_workflow()
     if issues:
-        raise ValueError(f"Workflow validation failed: {issues}")
+        raise ValueError("Workflow validation failed: " + "; ".join(issues))
     
     # Execute workflow
     return crew.execute(script_content)
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Shared Retry Helpers
+
+SDK detection, prompt limits, backoff and circuit breaker helpers used by
+both the text and image model wrappers.
+"""
+
+import importlib.util
+import random
+import re
+import sys
+import threading
+import time
+from typing import Optional, Dict, Any
+
+
+# Matches Retry-After hints embedded in API error messages
+_RETRY_AFTER_PATTERN = re.compile(r'retry[-_ ]after\W*(\d+(?:\.\d+)?)', re.IGNORECASE)
+
+
+def sdk_installed(module_name: str) -> bool:
+    """Check whether a module is importable without actually importing it."""
+    if module_name in sys.modules:
+        return sys.modules[module_name] is not None
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def lookup_prompt_limit(model_name: str, limits: Dict[str, int]) -> Optional[int]:
+    """
+    Find the prompt limit for a model by longest matching name prefix.
+    
+    Args:
+        model_name: Configured model name
+        limits: Mapping of model name prefixes to limits
+    
+    Returns:
+        The limit, or None if the model is unknown
+    """
+    matches = [prefix for prefix in limits if model_name.startswith(prefix)]
+    return limits[max(matches, key=len)] if matches else None
+
+
+def get_retry_after(error: Exception) -> Optional[float]:
+    """
+    Extract a Retry-After hint (in seconds) from an API error, if present.
+    
+    Args:
+        error: Exception raised by the Gemini client
+    
+    Returns:
+        Seconds to wait, or None if the error carries no usable hint
+    """
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None)
+    value = None
+    if headers is not None:
+        try:
+            value = headers.get('Retry-After') or headers.get('retry-after')
+        except Exception:
+            value = None
+    if value is None:
+        match = _RETRY_AFTER_PATTERN.search(str(error))
+        if match:
+            value = match.group(1)
+    try:
+        return max(float(value), 0.0) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float,
+                  retry_after: Optional[float] = None) -> float:
+    """
+    Calculate exponential backoff delay with full jitter.
+    
+    Args:
+        attempt: Current attempt number (0-based)
+        base_delay: Delay ceiling for the first attempt, in seconds
+        max_delay: Upper bound for any delay, in seconds
+        retry_after: Optional server-provided Retry-After hint in seconds
+    
+    Returns:
+        Delay in seconds
+    """
+    delay = random.uniform(0, min(base_delay * (2 ** attempt), max_delay))
+    if retry_after is not None:
+        delay = min(max(delay, retry_after), max_delay)
+    return delay
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker shared by all calls on one model instance."""
+    
+    def __init__(self, operation: str, threshold: int, cooldown: float, logger: Any):
+        """
+        Initialize a closed circuit.
+        
+        Args:
+            operation: Label used in messages, e.g. "Text generation"
+            threshold: Consecutive failed calls before the circuit opens
+            cooldown: Seconds the circuit stays open once tripped
+            logger: Logger that receives the trip warning
+        """
+        self.operation = operation
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.logger = logger
+        self.failure_count = 0
+        self.open_until = 0.0
+        self._lock = threading.Lock()
+    
+    def check(self) -> None:
+        """
+        Fail fast while the circuit is open.
+        
+        Raises:
+            RuntimeError: If recent calls exhausted their retries and the
+                cooldown period has not elapsed yet
+        """
+        with self._lock:
+            remaining = self.open_until - time.monotonic()
+        if remaining > 0:
+            raise RuntimeError(
+                f"{self.operation} circuit is open after repeated failures; "
+                f"retry in {remaining:.1f}s"
+            )
+    
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        with self._lock:
+            self.failure_count = 0
+            self.open_until = 0.0
+    
+    def record_failure(self) -> None:
+        """Count a failed call and open the circuit once the threshold is hit."""
+        with self._lock:
+            self.failure_count += 1
+            if self.failure_count >= self.threshold:
+                self.open_until = time.monotonic() + self.cooldown
+                self.logger.warning(
+                    f"{self.operation} circuit opened after {self.failure_count} consecutive failures",
+                    cooldown=self.cooldown
+                )
+
+
+class RetryingModel:
+    """
+    Retry bookkeeping shared by the Gemini model wrappers.
+    
+    Subclasses provide `logger`, `max_retries`, `_breaker` and a
+    `_calculate_backoff(attempt, retry_after)` method.
+    """
+    
+    def _handle_attempt_failure(self, attempt: int, error: Exception) -> float:
+        """Log a failed attempt and return how long to wait before the next one."""
+        wait_time = self._calculate_backoff(attempt, get_retry_after(error))
+        
+        self.logger.warning(
+            f"{self._breaker.operation} attempt {attempt + 1} failed: {error}",
+            wait_time=wait_time,
+            remaining_attempts=self.max_retries - attempt - 1
+        )
+        return wait_time
+    
+    def _raise_exhausted(self, last_exception: Optional[Exception]) -> None:
+        """Record the failure with the circuit breaker and raise the final error."""
+        self._breaker.record_failure()
+        error_msg = f"{self._breaker.operation} failed after {self.max_retries} attempts. Last error: {last_exception}"
+        self.logger.error(error_msg)
+        raise RuntimeError(error_msg)
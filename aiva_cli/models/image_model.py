@@ -6,20 +6,33 @@ Provides a clean interface for image generation using Google's Imagen 3 model
 with built-in retry logic, error handling, and automatic file saving.
 """
 
-import base64
+import asyncio
+import os
+import threading
 import time
 import traceback
 from pathlib import Path
 from typing import Optional, Dict, Any
 from io import BytesIO
 
-try:
-    from google import genai
-    from google.genai import types
-except ImportError:
-    raise ImportError(
-        "google-genai package is required. Install with: pip install google-genai"
-    )
+from ._retry import (
+    sdk_installed, lookup_prompt_limit, backoff_delay, CircuitBreaker, RetryingModel
+)
+
+
+_GENAI_IMPORT_ERROR = "google-genai package is required. Install with: pip install google-genai"
+
+if not sdk_installed('google.genai'):
+    raise ImportError(_GENAI_IMPORT_ERROR)
+
+# The SDK pulls in gRPC/protobuf/auth, so it is imported on first model use
+genai = None
+types = None
+
+# One client per API key so every model instance reuses the same
+# keep-alive connection pool instead of re-doing TCP/TLS handshakes
+_shared_clients: Dict[str, Any] = {}
+_shared_clients_lock = threading.Lock()
 
 try:
     from PIL import Image
@@ -32,7 +45,17 @@ from ..config.loader import load_config, get_gemini_api_key
 from ..logs.logger import get_logger
 
 
-class GeminiImageModel:
+# Maximum prompt length in characters by model family (longest prefix wins)
+_MAX_PROMPT_CHARS = {
+    'imagen-3': 2048,
+}
+
+# Backoff bounds in seconds; image operations run longer than text calls
+_BASE_DELAY = 2.0
+_MAX_DELAY = 120.0
+
+
+class GeminiImageModel(RetryingModel):
     """Wrapper for Gemini Imagen 3 image generation model."""
     
     def __init__(self, api_key: Optional[str] = None, model_name: Optional[str] = None):
@@ -52,10 +75,20 @@ class GeminiImageModel:
         self.max_retries = config.max_retries
         self.timeout = config.models.timeout
         self.image_format = config.output.image_format
+        self.max_prompt_chars = lookup_prompt_limit(self.model_name, _MAX_PROMPT_CHARS)
+        
+        # Circuit breaker state shared by all calls on this instance
+        self._breaker = CircuitBreaker(
+            "Image generation",
+            config.circuit_breaker_threshold,
+            config.circuit_breaker_cooldown,
+            self.logger
+        )
         
-        # Initialize the API client
+        # Initialize (or reuse) the API client
+        _load_genai()
         try:
-            self.client = genai.Client(api_key=self.api_key)
+            self.client = _get_shared_client(self.api_key)
             self.logger.info(f"Initialized Gemini API client for image model: {self.model_name}")
         except Exception as e:
             self.logger.error(f"Failed to initialize Gemini API client: {e}")
@@ -77,24 +110,7 @@ class GeminiImageModel:
             ValueError: If prompt is empty or path is invalid
             RuntimeError: If generation fails after all retries
         """
-        if not prompt or not prompt.strip():
-            raise ValueError("Prompt cannot be empty")
-        
-        # Ensure output path is a Path object
-        output_path = Path(output_path)
-        
-        # Create parent directories if they don't exist
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Ensure the file has the correct extension
-        if not output_path.suffix:
-            output_path = output_path.with_suffix(f".{self.image_format}")
-        
-        self.logger.info(
-            f"Generating image with prompt length: {len(prompt)}",
-            model=self.model_name,
-            output_path=str(output_path)
-        )
+        output_path = self._prepare_request(prompt, output_path)
         
         last_exception = None
         
@@ -104,79 +120,208 @@ class GeminiImageModel:
                 response = self.client.models.generate_images(
                     model=self.model_name,
                     prompt=prompt,
-                    config=types.GenerateImagesConfig(
-                        number_of_images=1,
-                        aspect_ratio="1:1",
-                        safety_filter_level="BLOCK_LOW_AND_ABOVE",
-                        person_generation="ALLOW_ADULT",
-                        **kwargs
-                    )
+                    config=self._build_images_config(**kwargs)
                 )
                 
-                if not response or not response.generated_images:
-                    raise RuntimeError("No images generated")
-                
-                # Get the first generated image
-                generated_image = response.generated_images[0]
-                
-                # Convert image data to PIL Image and save
-                image = Image.open(BytesIO(generated_image.image.image_bytes))
-                image.save(output_path)
+                image_data = self._encode_image(response, output_path)
+                self._save_image(image_data, output_path)
                 
                 self.logger.info(
                     f"Successfully generated and saved image on attempt {attempt + 1}",
-                    file_size=output_path.stat().st_size if output_path.exists() else 0
+                    file_size=len(image_data)
                 )
                 
+                self._breaker.record_success()
                 return output_path
                 
             except Exception as e:
                 last_exception = e
-                wait_time = self._calculate_backoff(attempt)
+                wait_time = self._handle_attempt_failure(attempt, e)
                 
-                self.logger.warning(
-                    f"Image generation attempt {attempt + 1} failed: {e}",
-                    wait_time=wait_time,
-                    remaining_attempts=self.max_retries - attempt - 1
+                if attempt < self.max_retries - 1:
+                    time.sleep(wait_time)
+                else:
+                    break
+        
+        self._raise_exhausted(last_exception)
+    
+    async def agenerate_image(self, prompt: str, output_path: Path, **kwargs) -> Path:
+        """
+        Asynchronously generate an image with the same retry semantics as generate_image.
+        
+        Uses the SDK's async client so many prompts can be awaited concurrently
+        (e.g. with asyncio.gather); the file write runs in a worker thread.
+        
+        Args:
+            prompt: The input prompt for image generation
+            output_path: Path where the generated image will be saved
+            **kwargs: Additional generation parameters
+            
+        Returns:
+            Path to the saved image file
+            
+        Raises:
+            ValueError: If prompt is empty or path is invalid
+            RuntimeError: If generation fails after all retries
+        """
+        output_path = self._prepare_request(prompt, output_path)
+        
+        last_exception = None
+        
+        for attempt in range(self.max_retries):
+            try:
+                response = await self.client.aio.models.generate_images(
+                    model=self.model_name,
+                    prompt=prompt,
+                    config=self._build_images_config(**kwargs)
+                )
+                
+                image_data = self._encode_image(response, output_path)
+                await asyncio.to_thread(self._save_image, image_data, output_path)
+                
+                self.logger.info(
+                    f"Successfully generated and saved image on attempt {attempt + 1}",
+                    file_size=len(image_data)
                 )
                 
+                self._breaker.record_success()
+                return output_path
+                
+            except Exception as e:
+                last_exception = e
+                wait_time = self._handle_attempt_failure(attempt, e)
+                
                 if attempt < self.max_retries - 1:
-                    time.sleep(wait_time)
+                    await asyncio.sleep(wait_time)
                 else:
                     break
         
-        # All retries failed
-        error_msg = f"Image generation failed after {self.max_retries} attempts. Last error: {last_exception}"
-        self.logger.error(error_msg)
-        raise RuntimeError(error_msg)
+        self._raise_exhausted(last_exception)
+    
+    def _prepare_request(self, prompt: str, output_path: Path) -> Path:
+        """
+        Validate the prompt and resolve the output path before dispatch.
+        
+        Args:
+            prompt: The input prompt for image generation
+            output_path: Requested output path
+            
+        Returns:
+            Output path with parent directories created and extension applied
+            
+        Raises:
+            ValueError: If the prompt is empty or too long
+            RuntimeError: If the circuit breaker is open
+        """
+        if not prompt or not prompt.strip():
+            raise ValueError("Prompt cannot be empty")
+        
+        # Reject prompts the API would refuse without paying for the round-trip
+        if self.max_prompt_chars is not None and len(prompt) > self.max_prompt_chars:
+            raise ValueError(
+                f"Prompt too long: {len(prompt)} characters exceeds the "
+                f"{self.max_prompt_chars} character limit of {self.model_name}"
+            )
+        
+        # An open circuit rejects the call before it creates directories or logs a start
+        self._breaker.check()
+        
+        # Ensure output path is a Path object
+        output_path = Path(output_path)
+        
+        # Create parent directories if they don't exist
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Ensure the file has the correct extension
+        if not output_path.suffix:
+            output_path = output_path.with_suffix(f".{self.image_format}")
+        
+        self.logger.info(
+            f"Generating image with prompt length: {len(prompt)}",
+            model=self.model_name,
+            output_path=str(output_path)
+        )
+        
+        return output_path
+    
+    def _build_images_config(self, **kwargs) -> Any:
+        """Build the Imagen request config with the project defaults."""
+        return types.GenerateImagesConfig(
+            number_of_images=1,
+            aspect_ratio="1:1",
+            safety_filter_level="BLOCK_LOW_AND_ABOVE",
+            person_generation="ALLOW_ADULT",
+            **kwargs
+        )
+    
+    def _encode_image(self, response: Any, output_path: Path) -> bytes:
+        """
+        Extract the first generated image and encode it for the output path.
+        
+        Args:
+            response: Imagen API response
+            output_path: Destination path; its extension selects the format
+            
+        Returns:
+            Encoded image bytes
+            
+        Raises:
+            RuntimeError: If the response carries no image
+        """
+        # Pick the first generated image that carries bytes
+        generated_images = response.generated_images if response else None
+        image_bytes = next(
+            (g.image.image_bytes for g in generated_images or () if getattr(g, 'image', None)),
+            None
+        )
+        if image_bytes is None:
+            raise RuntimeError("No images generated")
+        
+        # Convert image data to the requested format
+        image = Image.open(BytesIO(image_bytes))
+        buffer = BytesIO()
+        image.save(buffer, format=Image.registered_extensions().get(output_path.suffix.lower(), 'PNG'))
+        return buffer.getvalue()
     
     def _save_image(self, image_data: bytes, output_path: Path) -> None:
-        """Save image data to file."""
+        """
+        Save image data to file atomically via a temporary sibling file.
+        
+        Args:
+            image_data: Encoded image bytes
+            output_path: Final location of the image
+        """
+        tmp_path = output_path.with_suffix(output_path.suffix + '.tmp')
         try:
-            # Save binary image data to file
-            with open(output_path, 'wb') as f:
-                f.write(image_data)
+            # Write to a temp file first so a crash never leaves a torn image
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+            try:
+                view = memoryview(image_data)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, output_path)
                 
             self.logger.info(f"Image saved to {output_path}")
             
         except Exception as e:
+            tmp_path.unlink(missing_ok=True)
             self.logger.error(f"Failed to save image: {e}")
             raise
     
-    def _calculate_backoff(self, attempt: int) -> float:
+    def _calculate_backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
         """
-        Calculate exponential backoff delay.
+        Calculate exponential backoff delay with full jitter.
         
         Args:
             attempt: Current attempt number (0-based)
+            retry_after: Optional server-provided Retry-After hint in seconds
             
         Returns:
             Delay in seconds
         """
-        base_delay = 2.0  # Slightly longer for image generation
-        max_delay = 120.0  # Longer max delay for image operations
-        delay = min(base_delay * (2 ** attempt), max_delay)
-        return delay
+        return backoff_delay(attempt, _BASE_DELAY, _MAX_DELAY, retry_after)
     
     def validate_connection(self) -> bool:
         """
@@ -248,6 +393,50 @@ class GeminiImageModel:
         return generated_paths
 
 
+def _load_genai() -> None:
+    """Import the google-genai SDK on first use and bind the module globals."""
+    global genai, types
+    if genai is not None and types is not None:
+        return
+    try:
+        from google import genai as _genai
+        from google.genai import types as _types
+    except ImportError:
+        raise ImportError(_GENAI_IMPORT_ERROR)
+    if genai is None:
+        genai = _genai
+    if types is None:
+        types = _types
+
+
+def _get_shared_client(api_key: str) -> Any:
+    """
+    Get the process-wide Gemini client for an API key, creating it once.
+    
+    Args:
+        api_key: Gemini API key
+        
+    Returns:
+        Shared genai.Client instance
+    """
+    with _shared_clients_lock:
+        client = _shared_clients.get(api_key)
+        if client is None:
+            client = genai.Client(api_key=api_key)
+            _shared_clients[api_key] = client
+        return client
+
+
+def reset_shared_clients() -> None:
+    """
+    Drop every cached client so the next model instance builds a fresh one.
+    
+    Call after rotating API keys, or from tests that patch genai.
+    """
+    with _shared_clients_lock:
+        _shared_clients.clear()
+
+
 # Convenience function for quick image generation
 def generate_image(prompt: str, output_path: Path, **kwargs) -> Path:
     """
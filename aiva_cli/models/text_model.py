@@ -6,23 +6,47 @@ Provides a clean interface for text generation using Google's Gemini Pro model
 with built-in retry logic, error handling, and rate limiting support.
 """
 
+import asyncio
 import time
 import logging
 from typing import Optional, Dict, Any
 from pathlib import Path
 
-try:
-    import google.generativeai as genai
-except ImportError:
-    raise ImportError(
-        "google-generativeai package is required. Install with: pip install google-generativeai"
-    )
+from ._retry import (
+    sdk_installed, lookup_prompt_limit, backoff_delay, CircuitBreaker, RetryingModel
+)
+
+
+_GENAI_IMPORT_ERROR = "google-generativeai package is required. Install with: pip install google-generativeai"
+
+if not sdk_installed('google.generativeai'):
+    raise ImportError(_GENAI_IMPORT_ERROR)
+
+# The SDK pulls in gRPC/protobuf/auth, so it is imported on first model use
+genai = None
 
 from ..config.loader import load_config, get_gemini_api_key
 from ..logs.logger import get_logger
 
 
-class GeminiTextModel:
+# Approximate input token limits by model family (longest prefix wins)
+_MAX_PROMPT_TOKENS = {
+    'gemini-pro': 30720,
+    'gemini-1.0-pro': 30720,
+    'gemini-1.5-flash': 1048576,
+    'gemini-1.5-pro': 2097152,
+    'gemini-2.0-flash': 1048576,
+}
+
+# Rough characters-per-token ratio used for the local length pre-check
+_CHARS_PER_TOKEN = 4
+
+# Backoff bounds in seconds
+_BASE_DELAY = 1.0
+_MAX_DELAY = 60.0
+
+
+class GeminiTextModel(RetryingModel):
     """Wrapper for Gemini Pro text generation model."""
     
     def __init__(self, api_key: Optional[str] = None, model_name: Optional[str] = None):
@@ -43,8 +67,18 @@ class GeminiTextModel:
         self.temperature = config.models.temperature
         self.max_tokens = config.models.max_tokens
         self.timeout = config.models.timeout
+        self.max_prompt_tokens = lookup_prompt_limit(self.model_name, _MAX_PROMPT_TOKENS)
+        
+        # Circuit breaker state shared by all calls on this instance
+        self._breaker = CircuitBreaker(
+            "Text generation",
+            config.circuit_breaker_threshold,
+            config.circuit_breaker_cooldown,
+            self.logger
+        )
         
         # Configure the API
+        _load_genai()
         genai.configure(api_key=self.api_key)
         
         # Initialize the model
@@ -70,20 +104,7 @@ class GeminiTextModel:
             ValueError: If prompt is empty or invalid
             RuntimeError: If generation fails after all retries
         """
-        if not prompt or not prompt.strip():
-            raise ValueError("Prompt cannot be empty")
-        
-        # Merge generation parameters
-        generation_config = {
-            'temperature': kwargs.get('temperature', self.temperature),
-            'max_output_tokens': kwargs.get('max_tokens', self.max_tokens),
-        }
-        
-        self.logger.info(
-            f"Generating text with prompt length: {len(prompt)}",
-            model=self.model_name,
-            temperature=generation_config['temperature']
-        )
+        generation_config = self._prepare_request(prompt, **kwargs)
         
         last_exception = None
         
@@ -95,51 +116,131 @@ class GeminiTextModel:
                     generation_config=generation_config
                 )
                 
-                # Check if response is valid
-                if not response.text:
-                    raise RuntimeError("Empty response from Gemini API")
+                return self._handle_response(response, attempt)
                 
-                self.logger.info(
-                    f"Successfully generated text on attempt {attempt + 1}",
-                    response_length=len(response.text)
+            except Exception as e:
+                last_exception = e
+                wait_time = self._handle_attempt_failure(attempt, e)
+                
+                if attempt < self.max_retries - 1:
+                    time.sleep(wait_time)
+                else:
+                    break
+        
+        self._raise_exhausted(last_exception)
+    
+    async def agenerate_text(self, prompt: str, **kwargs) -> str:
+        """
+        Asynchronously generate text with the same retry semantics as generate_text.
+        
+        Uses the SDK's generate_content_async so many prompts can be awaited
+        concurrently (e.g. with asyncio.gather) without a thread per request.
+        
+        Args:
+            prompt: The input prompt for text generation
+            **kwargs: Additional generation parameters
+            
+        Returns:
+            Generated text as string
+            
+        Raises:
+            ValueError: If prompt is empty or invalid
+            RuntimeError: If generation fails after all retries
+        """
+        generation_config = self._prepare_request(prompt, **kwargs)
+        
+        last_exception = None
+        
+        for attempt in range(self.max_retries):
+            try:
+                response = await self.model.generate_content_async(
+                    prompt,
+                    generation_config=generation_config
                 )
                 
-                return response.text.strip()
+                return self._handle_response(response, attempt)
                 
             except Exception as e:
                 last_exception = e
-                wait_time = self._calculate_backoff(attempt)
-                
-                self.logger.warning(
-                    f"Text generation attempt {attempt + 1} failed: {e}",
-                    wait_time=wait_time,
-                    remaining_attempts=self.max_retries - attempt - 1
-                )
+                wait_time = self._handle_attempt_failure(attempt, e)
                 
                 if attempt < self.max_retries - 1:
-                    time.sleep(wait_time)
+                    await asyncio.sleep(wait_time)
                 else:
                     break
         
-        # All retries failed
-        error_msg = f"Text generation failed after {self.max_retries} attempts. Last error: {last_exception}"
-        self.logger.error(error_msg)
-        raise RuntimeError(error_msg)
+        self._raise_exhausted(last_exception)
+    
+    def _prepare_request(self, prompt: str, **kwargs) -> Dict[str, Any]:
+        """
+        Validate the prompt and build the generation config before dispatch.
+        
+        Args:
+            prompt: The input prompt for text generation
+            **kwargs: Additional generation parameters
+            
+        Returns:
+            Generation config for the API call
+            
+        Raises:
+            ValueError: If the prompt is empty or too long
+            RuntimeError: If the circuit breaker is open
+        """
+        if not prompt or not prompt.strip():
+            raise ValueError("Prompt cannot be empty")
+        
+        # Reject prompts the API would refuse without paying for the round-trip
+        if self.max_prompt_tokens is not None:
+            estimated_tokens = len(prompt) // _CHARS_PER_TOKEN
+            if estimated_tokens > self.max_prompt_tokens:
+                raise ValueError(
+                    f"Prompt too long: ~{estimated_tokens} tokens exceeds the "
+                    f"{self.max_prompt_tokens} token limit of {self.model_name}"
+                )
+        
+        # An open circuit rejects the call before it is logged as started
+        self._breaker.check()
+        
+        # Merge generation parameters
+        generation_config = {
+            'temperature': kwargs.get('temperature', self.temperature),
+            'max_output_tokens': kwargs.get('max_tokens', self.max_tokens),
+        }
+        
+        self.logger.info(
+            f"Generating text with prompt length: {len(prompt)}",
+            model=self.model_name,
+            temperature=generation_config['temperature']
+        )
+        
+        return generation_config
     
-    def _calculate_backoff(self, attempt: int) -> float:
+    def _handle_response(self, response: Any, attempt: int) -> str:
+        """Validate an API response and return its stripped text."""
+        # Check if response is valid
+        if not response.text:
+            raise RuntimeError("Empty response from Gemini API")
+        
+        self.logger.info(
+            f"Successfully generated text on attempt {attempt + 1}",
+            response_length=len(response.text)
+        )
+        
+        self._breaker.record_success()
+        return response.text.strip()
+    
+    def _calculate_backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
         """
-        Calculate exponential backoff delay.
+        Calculate exponential backoff delay with full jitter.
         
         Args:
             attempt: Current attempt number (0-based)
+            retry_after: Optional server-provided Retry-After hint in seconds
             
         Returns:
             Delay in seconds
         """
-        base_delay = 1.0
-        max_delay = 60.0
-        delay = min(base_delay * (2 ** attempt), max_delay)
-        return delay
+        return backoff_delay(attempt, _BASE_DELAY, _MAX_DELAY, retry_after)
     
     def validate_connection(self) -> bool:
         """
@@ -171,6 +272,18 @@ class GeminiTextModel:
         }
 
 
+def _load_genai() -> None:
+    """Import the google-generativeai SDK on first use and bind the module global."""
+    global genai
+    if genai is not None:
+        return
+    try:
+        import google.generativeai as _genai
+    except ImportError:
+        raise ImportError(_GENAI_IMPORT_ERROR)
+    genai = _genai
+
+
 # Convenience function for quick text generation
 def generate_text(prompt: str, **kwargs) -> str:
     """
@@ -4,19 +4,22 @@ This module provides stub tests to verify that agents are properly
 registered and the crew orchestrator functions correctly.
 """
 
+import threading
 import pytest
-import tempfile
-import shutil
+from collections import Counter
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+# Skip this module, rather than failing collection, if the package cannot import
+pytest.importorskip("aiva_cli.crew_config.crew")
+
 from .crew_config.agents import (
     BaseAgent, AgentResult, AgentStatus,
     ScriptAgent, SegmenterAgent, PromptGenAgent, ImageRenderAgent,
     get_agent, list_available_agents
 )
 from .crew_config.crew import (
-    AivaCrew, WorkflowConfig, WorkflowResult, WorkflowStatus,
+    AivaCrew, CycleDetectedError, WorkflowConfig, WorkflowResult, WorkflowStatus,
     ConsoleProgressCallback, create_crew, run_workflow
 )
 from .core.prompt_enhancer import StylePreset
@@ -37,22 +40,22 @@ class TestAgentRegistry:
         for agent_name in expected_agents:
             assert agent_name in agents
     
-    def test_get_agent_valid(self):
+    def test_get_agent_valid(self, agent_registry):
         """Test getting valid agents."""
         # Test each agent type
-        script_agent = get_agent("script")
+        script_agent = agent_registry["script"]
         assert isinstance(script_agent, ScriptAgent)
         assert script_agent.role == "Script Analyst"
         
-        segmenter_agent = get_agent("segmenter")
+        segmenter_agent = agent_registry["segmenter"]
         assert isinstance(segmenter_agent, SegmenterAgent)
         assert segmenter_agent.role == "Script Segmenter"
         
-        prompt_agent = get_agent("prompt_gen")
+        prompt_agent = agent_registry["prompt_gen"]
         assert isinstance(prompt_agent, PromptGenAgent)
         assert prompt_agent.role == "Prompt Generator"
         
-        render_agent = get_agent("image_render")
+        render_agent = agent_registry["image_render"]
         assert isinstance(render_agent, ImageRenderAgent)
         assert render_agent.role == "Image Renderer"
     
@@ -61,9 +64,9 @@ class TestAgentRegistry:
         with pytest.raises(ValueError, match="Unknown agent type"):
             get_agent("nonexistent_agent")
     
-    def test_agent_info_structure(self):
+    def test_agent_info_structure(self, agent_registry):
         """Test that agent info has expected structure."""
-        agent = get_agent("script")
+        agent = agent_registry["script"]
         info = agent.get_info()
         
         assert isinstance(info, dict)
@@ -82,19 +85,55 @@ class TestAgentRegistry:
 class TestAgentExecution:
     """Test individual agent execution (stub tests)."""
     
-    def test_script_agent_execution(self):
-        """Test script agent execution with mock data."""
-        agent = ScriptAgent()
-        
-        # Mock script content
-        script_content = "A young hero embarks on an epic journey."
+    @pytest.mark.parametrize("agent_name,payload,kwargs", [
+        (
+            "script",
+            "A young hero embarks on an epic journey.",
+            {}
+        ),
+        (
+            "segmenter",
+            {
+                "content": "A young hero embarks on an epic journey.",
+                "analysis": {"themes": ["adventure", "heroism"]}
+            },
+            {"target_segments": 5, "target_duration": 8.0}
+        ),
+        (
+            "prompt_gen",
+            {
+                "segments": [
+                    {"text": "Hero begins journey", "duration": 4.0},
+                    {"text": "Hero faces challenge", "duration": 4.0}
+                ]
+            },
+            {"style_preset": StylePreset.CINEMATIC_4K}
+        ),
+        pytest.param(
+            "image_render",
+            {
+                "enhanced_prompts": [
+                    "Cinematic shot of hero beginning epic journey",
+                    "Dramatic scene of hero facing first challenge"
+                ]
+            },
+            {"image_size": "512x512"},
+            marks=pytest.mark.slow
+        ),
+    ], ids=["script", "segmenter", "prompt_gen", "image_render"])
+    def test_agent_execution(self, agent_name, payload, kwargs, tmp_path, request):
+        """Test each agent's execution with mock data (stub tests)."""
+        agent = request.getfixturevalue(f"{agent_name}_agent")
+        kwargs = dict(kwargs)
+        if agent_name == "image_render":
+            kwargs["output_dir"] = str(tmp_path)
         
         # Execute agent (this is a stub - actual implementation may vary)
-        result = agent.execute(script_content)
+        result = agent.execute(payload, **kwargs)
         
         # Verify result structure
         assert isinstance(result, AgentResult)
-        assert result.agent_name == "script"
+        assert result.agent_name == agent_name
         assert result.status in [AgentStatus.COMPLETED, AgentStatus.FAILED]
         
         if result.status == AgentStatus.COMPLETED:
@@ -103,77 +142,41 @@ class TestAgentExecution:
         else:
             assert result.error is not None
     
-    def test_segmenter_agent_execution(self):
-        """Test segmenter agent execution with mock data."""
-        agent = SegmenterAgent()
-        
-        # Mock analyzed script data
-        script_data = {
-            "content": "A young hero embarks on an epic journey.",
-            "analysis": {"themes": ["adventure", "heroism"]}
-        }
-        
-        # Execute agent
-        result = agent.execute(script_data, target_segments=5, target_duration=8.0)
-        
-        # Verify result structure
-        assert isinstance(result, AgentResult)
-        assert result.agent_name == "segmenter"
-        assert result.status in [AgentStatus.COMPLETED, AgentStatus.FAILED]
-    
-    def test_prompt_gen_agent_execution(self):
-        """Test prompt generator agent execution with mock data."""
-        agent = PromptGenAgent()
-        
-        # Mock segmented data
-        segments_data = {
-            "segments": [
-                {"text": "Hero begins journey", "duration": 4.0},
-                {"text": "Hero faces challenge", "duration": 4.0}
-            ]
-        }
-        
-        # Execute agent
-        result = agent.execute(segments_data, style_preset=StylePreset.CINEMATIC_4K)
-        
-        # Verify result structure
-        assert isinstance(result, AgentResult)
-        assert result.agent_name == "prompt_gen"
-        assert result.status in [AgentStatus.COMPLETED, AgentStatus.FAILED]
-    
-    def test_image_render_agent_execution(self):
-        """Test image render agent execution with mock data."""
-        agent = ImageRenderAgent()
-        
-        # Mock enhanced prompts data
-        prompts_data = {
+    def test_image_render_parallel(self, image_render_agent, tmp_path, monkeypatch):
+        """Test that image rendering fans out across prompts."""
+        # Every render waits until all four are in flight, so serial rendering
+        # breaks the barrier (after the timeout) instead of passing
+        barrier = threading.Barrier(4, timeout=5)
+        
+        def overlapping_generate(prompt, size, index, output_dir):
+            barrier.wait()
+            return {"path": str(Path(output_dir) / "image.png"), "generation_time": 0.1}
+        
+        monkeypatch.setattr(image_render_agent, "_generate_image", overlapping_generate)
+        payload = {
             "enhanced_prompts": [
-                "Cinematic shot of hero beginning epic journey",
-                "Dramatic scene of hero facing first challenge"
+                {"segment_index": i, "enhanced_prompt": f"Prompt {i}"}
+                for i in range(1, 5)
             ]
         }
         
-        # Create temporary output directory
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Execute agent
-            result = agent.execute(
-                prompts_data, 
-                output_dir=temp_dir, 
-                image_size="512x512"
-            )
-            
-            # Verify result structure
-            assert isinstance(result, AgentResult)
-            assert result.agent_name == "image_render"
-            assert result.status in [AgentStatus.COMPLETED, AgentStatus.FAILED]
+        result = image_render_agent.execute(payload, output_dir=str(tmp_path), max_parallel=4)
+        
+        # All four renders were running at the same time
+        assert not barrier.broken
+        assert result.status == AgentStatus.COMPLETED
+        assert result.data["image_count"] == 4
+        assert [img["segment_index"] for img in result.data["generated_images"]] == [1, 2, 3, 4]
+        # Each image lands in its own segment directory
+        assert len({img["image_path"] for img in result.data["generated_images"]}) == 4
 
 
 class TestCrewOrchestrator:
     """Test crew orchestration functionality."""
     
-    def test_crew_initialization(self):
+    def test_crew_initialization(self, default_crew):
         """Test crew initialization with default config."""
-        crew = AivaCrew()
+        crew = default_crew
         
         # Verify agents are initialized
         assert len(crew.agents) == 4
@@ -205,17 +208,34 @@ class TestCrewOrchestrator:
         assert crew.config.style_preset == StylePreset.PHOTOREALISTIC
         assert crew.config.output_dir == "./custom_output"
     
-    def test_execution_order(self):
+    def test_execution_order(self, default_crew):
         """Test that execution order follows dependencies."""
-        crew = AivaCrew()
+        crew = default_crew
         execution_order = crew._get_execution_order()
         
-        expected_order = ["script", "segmenter", "prompt_gen", "image_render"]
+        expected_order = ("script", "segmenter", "prompt_gen", "image_render")
         assert execution_order == expected_order
+        
+        # Order is resolved once at init and reused on every call
+        assert crew._execution_order == expected_order
+        assert crew._get_execution_order() is execution_order
+    
+    def test_execution_order_detects_cycle(self, default_crew):
+        """Test that a cyclic dependency graph is rejected."""
+        crew = default_crew
+        crew.workflow_graph = {
+            "script": ["image_render"],
+            "segmenter": ["script"],
+            "prompt_gen": ["segmenter"],
+            "image_render": ["prompt_gen"]
+        }
+        
+        with pytest.raises(CycleDetectedError):
+            crew._topo_sort()
     
-    def test_workflow_validation(self):
+    def test_workflow_validation(self, default_crew):
         """Test workflow validation."""
-        crew = AivaCrew()
+        crew = default_crew
         issues = crew.validate_workflow()
         
         # Should have no issues with default setup
@@ -236,36 +256,72 @@ class TestCrewOrchestrator:
         assert any("target_segments must be positive" in issue for issue in issues)
         assert any("target_duration must be positive" in issue for issue in issues)
     
-    @patch('crew_config.agents.ScriptAgent.execute')
-    @patch('crew_config.agents.SegmenterAgent.execute')
-    @patch('crew_config.agents.PromptGenAgent.execute')
-    @patch('crew_config.agents.ImageRenderAgent.execute')
-    def test_workflow_execution_success(self, mock_render, mock_prompt, mock_segment, mock_script):
+    def test_workflow_validation_creates_output_dir(self, tmp_path):
+        """Test that every validation call ensures the output directory exists."""
+        output_dir = tmp_path / "out"
+        crew = AivaCrew(WorkflowConfig(output_dir=str(output_dir)))
+        assert crew.validate_workflow() == []
+        assert output_dir.is_dir()
+        
+        # A directory removed between calls is created again
+        output_dir.rmdir()
+        assert crew.validate_workflow() == []
+        assert output_dir.is_dir()
+    
+    def test_workflow_config_validate(self):
+        """Test that config validation reflects the current field values."""
+        assert WorkflowConfig().validate() == []
+        
+        config = WorkflowConfig(target_segments=0, target_duration=-2.0)
+        assert config.validate() == [
+            "target_segments must be positive",
+            "target_duration must be positive"
+        ]
+        
+        # Changes made after construction are still caught
+        config = WorkflowConfig()
+        config.target_segments = 0
+        assert config.validate() == ["target_segments must be positive"]
+    
+    @pytest.mark.slow
+    def test_workflow_execution_success(self, monkeypatch):
         """Test successful workflow execution with mocked agents."""
         # Setup mock returns
-        mock_script.return_value = AgentResult(
-            agent_name="script",
-            status=AgentStatus.COMPLETED,
-            data={"content": "test script", "analysis": {}}
-        )
-        
-        mock_segment.return_value = AgentResult(
-            agent_name="segmenter",
-            status=AgentStatus.COMPLETED,
-            data={"segments": [{"text": "segment 1", "duration": 4.0}]}
-        )
-        
-        mock_prompt.return_value = AgentResult(
-            agent_name="prompt_gen",
-            status=AgentStatus.COMPLETED,
-            data={"enhanced_prompts": ["enhanced prompt 1"]}
-        )
+        mock_results = {
+            "script": AgentResult(
+                agent_name="script",
+                status=AgentStatus.COMPLETED,
+                data={"content": "test script", "analysis": {}}
+            ),
+            "segmenter": AgentResult(
+                agent_name="segmenter",
+                status=AgentStatus.COMPLETED,
+                data={"segments": [{"text": "segment 1", "duration": 4.0}]}
+            ),
+            "prompt_gen": AgentResult(
+                agent_name="prompt_gen",
+                status=AgentStatus.COMPLETED,
+                data={"enhanced_prompts": ["enhanced prompt 1"]}
+            ),
+            "image_render": AgentResult(
+                agent_name="image_render",
+                status=AgentStatus.COMPLETED,
+                data={"images": ["image1.png"], "image_count": 1}
+            )
+        }
         
-        mock_render.return_value = AgentResult(
-            agent_name="image_render",
-            status=AgentStatus.COMPLETED,
-            data={"images": ["image1.png"], "image_count": 1}
-        )
+        agent_classes = {
+            "script": ScriptAgent,
+            "segmenter": SegmenterAgent,
+            "prompt_gen": PromptGenAgent,
+            "image_render": ImageRenderAgent
+        }
+        calls = Counter()
+        for name, agent_class in agent_classes.items():
+            monkeypatch.setattr(
+                agent_class, "execute",
+                lambda *args, _name=name, **kwargs: calls.update([_name]) or mock_results[_name]
+            )
         
         # Execute workflow
         crew = AivaCrew()
@@ -277,11 +333,8 @@ class TestCrewOrchestrator:
         assert result.error is None
         assert len(result.agent_results) == 4
         
-        # Verify all agents were called
-        mock_script.assert_called_once()
-        mock_segment.assert_called_once()
-        mock_prompt.assert_called_once()
-        mock_render.assert_called_once()
+        # Verify all agents were called exactly once
+        assert calls == {"script": 1, "segmenter": 1, "prompt_gen": 1, "image_render": 1}
     
     @patch('crew_config.agents.ScriptAgent.execute')
     def test_workflow_execution_failure(self, mock_script):
@@ -315,18 +368,38 @@ class TestProgressCallbacks:
         callback_quiet = ConsoleProgressCallback(verbose=False)
         assert callback_quiet.verbose is False
     
-    def test_callback_registration(self):
+    def test_console_callback_buffering(self, capsys):
+        """Test that a buffered callback writes nothing until the workflow completes."""
+        callback = ConsoleProgressCallback(verbose=True, buffer=True)
+        
+        callback.on_workflow_start(WorkflowConfig(target_segments=3))
+        callback.on_agent_error("script", "boom")
+        assert capsys.readouterr().out == ""
+        
+        callback.on_workflow_complete(WorkflowResult(status=WorkflowStatus.FAILED, error="boom"))
+        output = capsys.readouterr().out
+        assert "Starting AIVA workflow with 3 segments" in output
+        assert "script: Error - boom" in output
+        assert "Workflow failed: boom" in output
+    
+    def test_callback_registration(self, default_crew):
         """Test callback registration with crew."""
-        crew = AivaCrew()
+        crew = default_crew
         callback = ConsoleProgressCallback()
         
         # Add callback
         crew.add_callback(callback)
         assert callback in crew.callbacks
+        assert crew.has_callback(callback)
+        
+        # Adding it again does not register it twice
+        crew.add_callback(callback)
+        assert crew.callbacks.count(callback) == 1
         
         # Remove callback
         crew.remove_callback(callback)
         assert callback not in crew.callbacks
+        assert not crew.has_callback(callback)
     
     def test_callback_methods_exist(self):
         """Test that callback has all required methods."""
@@ -382,6 +455,11 @@ class TestConvenienceFunctions:
         
         with pytest.raises(ValueError, match="Workflow validation failed"):
             run_workflow("Test script", config=config, verbose=False)
+    
+    def test_strict_config_fails_at_construction(self):
+        """Test that a strict invalid config raises before any crew is built."""
+        with pytest.raises(ValueError, match="Workflow validation failed"):
+            WorkflowConfig(target_segments=-1, strict=True)
 
 
 class TestWorkflowResult:
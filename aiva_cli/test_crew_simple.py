@@ -2,72 +2,89 @@
 
 This module provides basic tests to verify that agents are properly
 registered and the crew orchestrator functions correctly without
-requiring external testing frameworks.
+requiring external testing frameworks. Run it standalone from the
+repository root with ``python -m aiva_cli.test_crew_simple [--parallel] [--quiet]``
+so the absolute imports resolve without touching sys.path.
+
+Every assertion carries its own message, so pytest's assertion rewriting
+is switched off for this module: PYTEST_DONT_REWRITE
 """
 
+import contextlib
+import io
+import multiprocessing
+import os
 import sys
-import traceback
-from pathlib import Path
-import pytest # Moved import here
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 
 try:
     # Import modules using absolute imports
-    from aiva_cli.crew_config import agents as agents_module
-    from aiva_cli.crew_config import crew as crew_module
-    from aiva_cli.core import prompt_enhancer as enhancer_module
-    
-    # Extract specific classes and functions
-    BaseAgent = agents_module.BaseAgent
-    AgentResult = agents_module.AgentResult
-    AgentStatus = agents_module.AgentStatus
-    ScriptAgent = agents_module.ScriptAgent
-    SegmenterAgent = agents_module.SegmenterAgent
-    PromptGenAgent = agents_module.PromptGenAgent
-    ImageRenderAgent = agents_module.ImageRenderAgent
-    get_agent = agents_module.get_agent
-    list_available_agents = agents_module.list_available_agents
-    
-    AivaCrew = crew_module.AivaCrew
-    WorkflowConfig = crew_module.WorkflowConfig
-    WorkflowResult = crew_module.WorkflowResult
-    WorkflowStatus = crew_module.WorkflowStatus
-    ConsoleProgressCallback = crew_module.ConsoleProgressCallback
-    create_crew = crew_module.create_crew
-    
-    StylePreset = enhancer_module.StylePreset
+    from aiva_cli.crew_config.agents import (
+        BaseAgent, AgentResult, AgentStatus,
+        ScriptAgent, SegmenterAgent, PromptGenAgent, ImageRenderAgent,
+        get_agent, list_available_agents
+    )
+    from aiva_cli.crew_config.crew import (
+        AivaCrew, WorkflowConfig, WorkflowResult, WorkflowStatus,
+        ConsoleProgressCallback, create_crew
+    )
+    from aiva_cli.core.prompt_enhancer import StylePreset
     
 except ImportError as e:
+    import traceback
     print(f"❌ Import error: {e}")
     print("Make sure all required modules are available.")
     traceback.print_exc()  # Add this line to print the full traceback
     sys.exit(1)
 
 
+# Agents every crew must provide, in dependency order
+EXPECTED_ORDER = ("script", "segmenter", "prompt_gen", "image_render")
+EXPECTED_AGENTS = frozenset(EXPECTED_ORDER)
+
+# Keys every agent's get_info() must return
+REQUIRED_FIELDS = ("role", "goal", "backstory", "tools")
+
+
+def _report(msgs):
+    """Write a test's progress lines in one go when AIVA_TEST_VERBOSE is set."""
+    if os.environ.get("AIVA_TEST_VERBOSE"):
+        sys.stdout.write("\n".join(msgs) + "\n")
+
+
+@lru_cache(maxsize=None)
+def _agent(name):
+    """Build each agent once; the read-only checks below can share it."""
+    return get_agent(name)
+
+
+@lru_cache(maxsize=None)
+def _info(name):
+    """Cache get_info() for a shared agent."""
+    return _agent(name).get_info()
+
+
 def test_agent_registry():
     """Test agent registration and retrieval."""
-    print("\n🧪 Testing Agent Registry...")
+    msgs = ["\n🧪 Testing Agent Registry..."]
     
     # Test list_available_agents
-    try:
-        agents = list_available_agents()
-        expected_agents = ["script", "segmenter", "prompt_gen", "image_render"]
-        
-        print(f"   Available agents: {agents}")
-        
-        for agent_name in expected_agents:
-            assert agent_name in agents, f"{agent_name} agent is missing"
-            print(f"   ✅ {agent_name} agent is registered")
-        
-        print("   ✅ All agent registry checks passed")
-        
-    except Exception as e:
-        print(f"   ❌ Error testing agent registry: {e}")
-        raise # Re-raise the exception to fail the test
+    agents = list_available_agents()
+    msgs.append(f"   Available agents: {agents}")
+    
+    missing = EXPECTED_AGENTS - set(agents)
+    assert not missing, f"Agents missing from registry: {sorted(missing)}"
+    msgs.append(f"   ✅ Registered: {', '.join(EXPECTED_ORDER)}")
+    
+    msgs.append("   ✅ All agent registry checks passed")
+    
+    _report(msgs)
 
 
 def test_agent_creation():
     """Test creating individual agents."""
-    print("\n🧪 Testing Agent Creation...")
+    msgs = ["\n🧪 Testing Agent Creation..."]
     
     agent_types = [
         ("script", ScriptAgent, "Script Analyst and Preprocessor"),
@@ -77,59 +94,61 @@ def test_agent_creation():
     ]
     
     for agent_name, agent_class, expected_role in agent_types:
-        try:
-            # Test get_agent function
-            agent = get_agent(agent_name)
-            
-            assert isinstance(agent, agent_class), f"{agent_name} agent has wrong type: {type(agent)}"
-            print(f"   ✅ {agent_name} agent created successfully")
-            
-            # Test agent info
-            info = agent.get_info()
-            assert info.get("role") == expected_role, f"{agent_name} has wrong role: {info.get('role')}"
-            print(f"   ✅ {agent_name} has correct role: {expected_role}")
-            
-            # Check info structure
-            required_fields = ["role", "goal", "backstory", "tools"]
-            for field in required_fields:
-                assert field in info, f"{agent_name} missing {field} in info"
-            
-            print(f"   ✅ {agent_name} info structure is valid")
-            
-        except Exception as e:
-            print(f"   ❌ Error creating {agent_name} agent: {e}")
-            raise  # Re-raise the exception to fail the test
+        # Test get_agent function
+        agent = _agent(agent_name)
+        
+        actual = type(agent)
+        assert actual is agent_class, f"{agent_name} agent has wrong type: {actual}"
+        msgs.append(f"   ✅ {agent_name} agent created successfully")
+        
+        # Test agent info
+        info = _info(agent_name)
+        role = info["role"]
+        assert role == expected_role, f"{agent_name} has wrong role: {role}"
+        msgs.append(f"   ✅ {agent_name} has correct role: {expected_role}")
+        
+        # Check info structure
+        for field in REQUIRED_FIELDS:
+            assert field in info, f"{agent_name} missing {field} in info"
+        
+        msgs.append(f"   ✅ {agent_name} info structure is valid")
     
-    print("   ✅ All agent creation checks passed")
+    msgs.append("   ✅ All agent creation checks passed")
+    
+    _report(msgs)
 
 
 def test_invalid_agent():
     """Test that invalid agent names raise errors."""
-    print("\n🧪 Testing Invalid Agent Handling...")
+    msgs = ["\n🧪 Testing Invalid Agent Handling..."]
+    
+    # Imported here so the standalone runner does not load pytest up front
+    import pytest
     
     with pytest.raises(ValueError, match="Unknown agent type"):
         get_agent("nonexistent_agent")
-    print("   ✅ Correctly raised ValueError for invalid agent with expected message")
+    msgs.append("   ✅ Correctly raised ValueError for invalid agent with expected message")
     
-    print("   ✅ All invalid agent handling checks passed")
+    msgs.append("   ✅ All invalid agent handling checks passed")
+    
+    _report(msgs)
 
 
-def test_crew_creation():
+def test_crew_creation(default_crew):
     """Test crew creation and initialization."""
-    print("\n🧪 Testing Crew Creation...")
+    msgs = ["\n🧪 Testing Crew Creation..."]
     
     # Test default crew creation
-    crew = AivaCrew()
+    crew = default_crew
     
     # Check agents are initialized
     assert len(crew.agents) == 4, f"Expected 4 agents, got {len(crew.agents)}"
-    print(f"   ✅ Crew initialized with {len(crew.agents)} agents")
+    msgs.append(f"   ✅ Crew initialized with {len(crew.agents)} agents")
     
     # Check specific agents
-    expected_agents = ["script", "segmenter", "prompt_gen", "image_render"]
-    for agent_name in expected_agents:
-        assert agent_name in crew.agents, f"{agent_name} agent missing from crew"
-        print(f"   ✅ {agent_name} agent present in crew")
+    missing = EXPECTED_AGENTS - crew.agents.keys()
+    assert not missing, f"Agents missing from crew: {sorted(missing)}"
+    msgs.append(f"   ✅ Present in crew: {', '.join(EXPECTED_ORDER)}")
     
     # Check workflow graph
     expected_graph = {
@@ -141,14 +160,16 @@ def test_crew_creation():
     
     assert crew.workflow_graph == expected_graph, \
         f"Workflow graph mismatch. Expected: {expected_graph}, Got: {crew.workflow_graph}"
-    print("   ✅ Workflow graph is correct")
+    msgs.append("   ✅ Workflow graph is correct")
 
-    print("   ✅ All crew creation checks passed")
+    msgs.append("   ✅ All crew creation checks passed")
+    
+    _report(msgs)
 
 
 def test_crew_with_config():
     """Test crew creation with custom configuration."""
-    print("\n🧪 Testing Crew with Custom Config...")
+    msgs = ["\n🧪 Testing Crew with Custom Config..."]
     
     config = WorkflowConfig(
         target_segments=8,
@@ -161,50 +182,52 @@ def test_crew_with_config():
     
     # Verify config is applied
     assert crew.config.target_segments == 8, f"target_segments wrong: {crew.config.target_segments}"
-    print("   ✅ target_segments config applied")
+    msgs.append("   ✅ target_segments config applied")
     
     assert crew.config.target_duration == 10.0, f"target_duration wrong: {crew.config.target_duration}"
-    print("   ✅ target_duration config applied")
+    msgs.append("   ✅ target_duration config applied")
     
     assert crew.config.style_preset == StylePreset.REALISTIC, f"style_preset wrong: {crew.config.style_preset}"
-    print("   ✅ style_preset config applied")
+    msgs.append("   ✅ style_preset config applied")
     
     # output_dir is also part of the config, let's assert that too for completeness
     assert crew.config.output_dir == "./test_output", f"output_dir wrong: {crew.config.output_dir}"
-    print("   ✅ output_dir config applied")
+    msgs.append("   ✅ output_dir config applied")
 
-    print("   ✅ All custom config checks passed")
+    msgs.append("   ✅ All custom config checks passed")
+    
+    _report(msgs)
 
 
-def test_execution_order():
+def test_execution_order(default_crew):
     """Test that execution order follows dependencies."""
-    print("\n🧪 Testing Execution Order...")
+    msgs = ["\n🧪 Testing Execution Order..."]
     
-    crew = AivaCrew()
+    crew = default_crew
     execution_order = crew._get_execution_order()
     
-    expected_order = ["script", "segmenter", "prompt_gen", "image_render"]
+    assert execution_order == EXPECTED_ORDER, \
+        f"Execution order wrong. Expected: {EXPECTED_ORDER}, Got: {execution_order}"
+    msgs.append(f"   ✅ Execution order is correct: {execution_order}")
     
-    assert execution_order == expected_order, \
-        f"Execution order wrong. Expected: {expected_order}, Got: {execution_order}"
-    print(f"   ✅ Execution order is correct: {execution_order}")
+    msgs.append("   ✅ All execution order checks passed")
     
-    print("   ✅ All execution order checks passed")
+    _report(msgs)
 
 
-def test_workflow_validation():
+def test_workflow_validation(default_crew):
     """Test workflow validation."""
-    print("\n🧪 Testing Workflow Validation...")
+    msgs = ["\n🧪 Testing Workflow Validation..."]
     
     # Test valid configuration
-    crew = AivaCrew()
+    crew = default_crew
     issues = crew.validate_workflow()
     # Assuming a valid default config should have 0 issues.
     # If there can be informational 'issues' for a valid config, this assert might need adjustment.
     assert len(issues) == 0, f"Expected 0 validation issues for default config, got {len(issues)}: {issues}"
-    print(f"   Validation issues found for default config: {len(issues)}")
+    msgs.append(f"   Validation issues found for default config: {len(issues)}")
     for issue in issues:
-        print(f"   ⚠️  {issue}")
+        msgs.append(f"   ⚠️  {issue}")
     
     # Test invalid configuration
     invalid_config = WorkflowConfig(
@@ -215,62 +238,66 @@ def test_workflow_validation():
     invalid_crew = AivaCrew(invalid_config)
     invalid_issues = invalid_crew.validate_workflow()
     
-    expected_issue_substrings = [
+    expected_issue_substrings = (
         "target_segments must be positive",
         "target_duration must be positive"
-    ]
+    )
     
-    # Check that each expected substring is present in at least one of the reported issues
-    for expected_substring in expected_issue_substrings:
-        assert any(expected_substring in issue for issue in invalid_issues), \
-            f"Missing expected validation issue containing: '{expected_substring}' in {invalid_issues}"
-        print(f"   ✅ Found expected validation issue: {expected_substring}")
+    # One pass over the issues, then one substring search per expectation
+    joined_issues = "\n".join(invalid_issues)
+    missing = [sub for sub in expected_issue_substrings if sub not in joined_issues]
+    assert not missing, f"Missing expected validation issues {missing} in {invalid_issues}"
+    msgs.append(f"   ✅ Found expected validation issues: {', '.join(expected_issue_substrings)}")
 
     # Optionally, assert the exact number of issues if it's strictly defined for this invalid case
     # assert len(invalid_issues) == len(expected_issue_substrings), \
     #     f"Expected {len(expected_issue_substrings)} issues for invalid config, got {len(invalid_issues)}: {invalid_issues}"
 
-    print("   ✅ Validation correctly identifies invalid config")
+    msgs.append("   ✅ Validation correctly identifies invalid config")
+    
+    _report(msgs)
 
 
 def test_convenience_functions():
     """Test convenience functions."""
-    print("\n🧪 Testing Convenience Functions...")
+    msgs = ["\n🧪 Testing Convenience Functions..."]
     
     # Test create_crew
     crew = create_crew()
     assert isinstance(crew, AivaCrew), f"create_crew() returned wrong type: {type(crew)}"
-    print("   ✅ create_crew() works")
+    msgs.append("   ✅ create_crew() works")
     
     # Test create_crew with config
     config = WorkflowConfig(target_segments=5)
     crew_custom = create_crew(config)
     assert crew_custom.config.target_segments == 5, \
         f"create_crew(config) wrong segments: {crew_custom.config.target_segments}"
-    print("   ✅ create_crew(config) works")
+    msgs.append("   ✅ create_crew(config) works")
+    
+    msgs.append("   ✅ All convenience function checks passed")
     
-    print("   ✅ All convenience function checks passed")
+    _report(msgs)
 
 
-def test_progress_callbacks():
+def test_progress_callbacks(default_crew):
     """Test progress callback functionality."""
-    print("\n🧪 Testing Progress Callbacks...")
+    msgs = ["\n🧪 Testing Progress Callbacks..."]
     
     # Test callback creation
     callback = ConsoleProgressCallback(verbose=True)
     assert callback.verbose is True, "ConsoleProgressCallback verbose flag wrong"
-    print("   ✅ ConsoleProgressCallback created")
+    msgs.append("   ✅ ConsoleProgressCallback created")
     
-    # Test callback registration
-    crew = AivaCrew()
+    # Test callback registration (default_crew has its own callback list)
+    crew = default_crew
     crew.add_callback(callback)
-    assert callback in crew.callbacks, "Callback not added to crew"
-    print("   ✅ Callback added to crew")
+    assert crew.has_callback(callback), "Callback not added to crew"
+    msgs.append("   ✅ Callback added to crew")
     
     # Test callback removal
     crew.remove_callback(callback)
-    assert callback not in crew.callbacks, "Callback not removed from crew"
-    print("   ✅ Callback removed from crew")
+    assert not crew.has_callback(callback), "Callback not removed from crew"
+    msgs.append("   ✅ Callback removed from crew")
     
     # Test callback methods exist
     required_methods = [
@@ -281,45 +308,91 @@ def test_progress_callbacks():
     for method_name in required_methods:
         assert hasattr(callback, method_name) and callable(getattr(callback, method_name)), \
             f"{method_name} method missing or not callable"
-        print(f"   ✅ {method_name} method exists")
+        msgs.append(f"   ✅ {method_name} method exists")
+    
+    msgs.append("   ✅ All progress callback checks passed")
     
-    print("   ✅ All progress callback checks passed")
+    _report(msgs)
 
 
-def run_all_tests():
-    """Run all tests and report results."""
+@lru_cache(maxsize=None)
+def _shared_crew():
+    """Default crew shared by the standalone runner, as the pytest fixture does."""
+    return AivaCrew()
+
+
+def _run_test(test_func, needs_crew, tracebacks=True):
+    """Run one test with its output captured.
+    
+    Args:
+        test_func: Test function to call
+        needs_crew: Whether the test takes the shared default crew
+        tracebacks: Format the traceback of a failure; skipped otherwise
+            so quiet runs never pay for walking the stack
+    
+    Returns:
+        Tuple of (error message or None, captured output, formatted traceback or None)
+    """
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        try:
+            if needs_crew:
+                test_func(_shared_crew())
+            else:
+                test_func()
+        except Exception as e:
+            if not tracebacks:
+                return str(e), output.getvalue(), None
+            import traceback
+            return str(e), output.getvalue(), traceback.format_exc()
+    return None, output.getvalue(), None
+
+
+# (display name, test function, whether it takes the default crew)
+_TESTS = [
+    ("Agent Registry", test_agent_registry, False),
+    ("Agent Creation", test_agent_creation, False),
+    ("Invalid Agent Handling", test_invalid_agent, False),
+    ("Crew Creation", test_crew_creation, True),
+    ("Crew with Custom Config", test_crew_with_config, False),
+    ("Execution Order", test_execution_order, True),
+    ("Workflow Validation", test_workflow_validation, True),
+    ("Convenience Functions", test_convenience_functions, False),
+    ("Progress Callbacks", test_progress_callbacks, True)
+]
+
+
+def run_all_tests(parallel: bool = False, tracebacks: bool = True):
+    """Run all tests and report results.
+    
+    Args:
+        parallel: Run the tests in separate processes. They share no state,
+            so their captured output is still reported in the usual order.
+        tracebacks: Print the full traceback of each failing test
+    """
     print("🚀 Starting AIVA Crew Configuration Tests")
     print("=" * 50)
     
-    tests = [
-        ("Agent Registry", test_agent_registry),
-        ("Agent Creation", test_agent_creation),
-        ("Invalid Agent Handling", test_invalid_agent),
-        ("Crew Creation", test_crew_creation),
-        ("Crew with Custom Config", test_crew_with_config),
-        ("Execution Order", test_execution_order),
-        ("Workflow Validation", test_workflow_validation),
-        ("Convenience Functions", test_convenience_functions),
-        ("Progress Callbacks", test_progress_callbacks)
-    ]
+    calls = [(test_func, needs_crew, tracebacks) for _, test_func, needs_crew in _TESTS]
+    if parallel:
+        with ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn")) as executor:
+            outcomes = list(executor.map(_run_test, *zip(*calls)))
+    else:
+        outcomes = (_run_test(*call) for call in calls)
     
     passed = 0
     failed = 0
     failed_tests = []
     
-    for test_name, test_func in tests:
-        try:
-            result = test_func()
-            if result:
-                print(f"\n✅ {test_name}: PASSED")
-                passed += 1
-            else:
-                print(f"\n❌ {test_name}: FAILED")
-                failed += 1
-                failed_tests.append(test_name)
-        except Exception as e:
-            print(f"\n💥 {test_name}: ERROR - {e}")
-            traceback.print_exc()
+    for (test_name, _, _), (error, output, formatted_tb) in zip(_TESTS, outcomes):
+        sys.stdout.write(output)
+        if error is None:
+            print(f"\n✅ {test_name}: PASSED")
+            passed += 1
+        else:
+            print(f"\n💥 {test_name}: ERROR - {error}")
+            if formatted_tb:
+                sys.stderr.write(formatted_tb)
             failed += 1
             failed_tests.append(test_name)
     
@@ -335,5 +408,10 @@ def run_all_tests():
 
 
 if __name__ == "__main__":
-    success = run_all_tests()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    # The standalone runner is interactive, so show progress lines by default
+    os.environ.setdefault("AIVA_TEST_VERBOSE", "1")
+    success = run_all_tests(
+        parallel="--parallel" in sys.argv[1:],
+        tracebacks="--quiet" not in sys.argv[1:]
+    )
+    sys.exit(0 if success else 1)
@@ -5,23 +5,91 @@ Simplified access to AI Video Generation Assistant
 """
 
 import os
+import re
 import sys
 import subprocess
 import json
-import time
+import shutil
+import codecs
+import collections
+import contextlib
+import functools
+import heapq
+import importlib
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-import termios
-import tty
-import select
 
-# Add the project root to Python path
+# orjson is optional; manifests fall back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+
+def _ensure_on_path():
+    """Put the project root on sys.path once, right before importing aiva_cli."""
+    root = str(project_root)
+    if root not in sys.path:
+        sys.path.insert(0, root)
+
+# Cursor home, clear screen, clear scrollback (what `clear` emits)
+_CLEAR_SEQUENCE = '\x1b[H\x1b[2J\x1b[3J'
+
+@functools.lru_cache(maxsize=None)
+def _is_tty():
+    """Whether both stdin and stdout are terminals; probed once per process."""
+    return sys.stdin.isatty() and sys.stdout.isatty()
 
 def clear_screen():
     """Clear the terminal screen."""
-    os.system('clear' if os.name == 'posix' else 'cls')
+    # Nothing to clear when output is piped or redirected
+    if not _is_tty():
+        return
+    # Writing the escape sequence avoids forking a shell on every redraw
+    if os.name == 'posix' or _enable_vt_mode():
+        sys.stdout.write(_CLEAR_SEQUENCE)
+        sys.stdout.flush()
+    else:
+        os.system('cls')
+
+@functools.lru_cache(maxsize=None)
+def _enable_vt_mode():
+    """Enable ANSI escape handling in the Windows console once; False if unavailable."""
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except Exception:
+        return False
+
+@functools.lru_cache(maxsize=None)
+def _probe(module_name):
+    """Import a module once and remember the outcome; None if it is not installed."""
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        return None
+
+@functools.lru_cache(maxsize=None)
+def _is_installed(module_name):
+    """Check that a module can be imported without importing it."""
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+def _write_lines(lines):
+    """Write a block of output lines to the terminal in one call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 def print_banner():
     """Print the AIVA CLI banner."""
@@ -35,45 +103,68 @@ def print_banner():
     """
     print(banner)
 
+# Menu entries and their pre-formatted, unselected lines
+_MENU_OPTIONS = (
+    "🚀 Generate Video Content",
+    "📁 List Recent Projects",
+    "🔧 Check Configuration",
+    "📊 View System Status",
+    "📖 Help & Documentation",
+    "🚪 Exit",
+)
+_MENU_LINES_BASE = tuple(f"    {i+1}. {option}" for i, option in enumerate(_MENU_OPTIONS))
+
 def show_menu(selected_index=0):
     """Display the main menu options with selection highlighting."""
-    menu_options = [
-        "🚀 Generate Video Content",
-        "📁 List Recent Projects", 
-        "🔧 Check Configuration",
-        "📊 View System Status",
-        "📖 Help & Documentation",
-        "🚪 Exit"
-    ]
+    if _is_tty():
+        hint = "Use ↑/↓ arrow keys to navigate, Enter to select, or type number (1-6)"
+    else:
+        hint = "Type number (1-6) and press Enter"
+    lines = ["\n📋 Main Menu:", hint, "-" * 60]
     
-    print("\n📋 Main Menu:")
-    print("Use ↑/↓ arrow keys to navigate, Enter to select, or type number (1-6)")
-    print("-" * 60)
+    # Only the highlighted entry needs formatting on each redraw
+    lines.extend(_MENU_LINES_BASE)
+    if 0 <= selected_index < len(_MENU_OPTIONS):
+        lines[3 + selected_index] = _selected_menu_line(selected_index)
+    lines.append("-" * 60)
     
-    for i, option in enumerate(menu_options):
-        if i == selected_index:
-            print(f"  ► {i+1}. {option} ◄")
-        else:
-            print(f"    {i+1}. {option}")
-    print("-" * 60)
+    _write_lines(lines)
+
+def _selected_menu_line(index):
+    """Format a main menu entry with the selection markers."""
+    return f"  ► {index+1}. {_MENU_OPTIONS[index]} ◄"
+
+# Lines printed below the last menu entry: separator, blank line, navigation hint
+_MENU_FOOTER_LINES = 3
+
+def _update_selection(old_index, new_index):
+    """Rewrite only the two menu lines whose highlight changed, in place."""
+    out = []
+    for index, text in ((old_index, _MENU_LINES_BASE[old_index]),
+                        (new_index, _selected_menu_line(new_index))):
+        # Move up relative to the cursor so a scrolled screen still lines up
+        up = len(_MENU_OPTIONS) - index + _MENU_FOOTER_LINES
+        out.append(f"\x1b[{up}A\r\x1b[2K{text}\r\x1b[{up}B")
+    sys.stdout.write(''.join(out))
+    sys.stdout.flush()
+
+_REQUIRED_DEPS = (
+    ('google.generativeai', 'Google Generative AI'),
+    ('PIL', 'Pillow'),
+    ('typer', 'Typer'),
+    ('rich', 'Rich'),
+)
+
+@functools.lru_cache(maxsize=None)
+def _missing_dependencies():
+    """Display names of required packages that are not installed; computed once."""
+    # Only locate the packages; the pipeline imports them when generation starts
+    return tuple(display_name for module_name, display_name in _REQUIRED_DEPS
+                 if not _is_installed(module_name))
 
 def check_dependencies():
     """Check if required dependencies are available."""
-    missing_deps = []
-    
-    # Check each dependency individually
-    deps_to_check = [
-        ('google.generativeai', 'Google Generative AI'),
-        ('PIL', 'Pillow'),
-        ('typer', 'Typer'),
-        ('rich', 'Rich')
-    ]
-    
-    for module_name, display_name in deps_to_check:
-        try:
-            __import__(module_name)
-        except ImportError:
-            missing_deps.append(display_name)
+    missing_deps = _missing_dependencies()
     
     if missing_deps:
         print(f"\n❌ Missing dependencies: {', '.join(missing_deps)}")
@@ -83,17 +174,17 @@ def check_dependencies():
     
     return True
 
+_VIDEO_TYPES = (
+    ("long-form", "🎬 Long-form Video (10+ minutes, detailed content)"),
+    ("short", "📱 Short Video (< 1 minute, quick content)"),
+)
+
 def select_video_type():
     """Interactive video type selection."""
-    video_types = [
-        ("long-form", "🎬 Long-form Video (10+ minutes, detailed content)"),
-        ("short", "📱 Short Video (< 1 minute, quick content)")
-    ]
-    
     print("\n🎬 Select Video Type:")
     print("-" * 30)
     
-    for i, (type_key, description) in enumerate(video_types, 1):
+    for i, (type_key, description) in enumerate(_VIDEO_TYPES, 1):
         print(f"{i}. {description}")
     
     while True:
@@ -213,6 +304,7 @@ def generate_video_content():
     
     try:
         # Import and call the generation function directly
+        _ensure_on_path()
         from aiva_cli.core.pipeline import generate_content
         from aiva_cli.config.loader import load_config
         
@@ -252,71 +344,226 @@ def generate_video_content():
         print(f"\n❌ Error during generation: {e}")
         print("💡 Make sure all dependencies are installed and configured properly.")
 
+# File extensions counted as generated images
+_IMG_EXTS = frozenset({'.png', '.jpg', '.jpeg'})
+
+def _stat_projects(output_dir, inode_order=True):
+    """Return project folders as unordered (path, mtime) pairs.
+    
+    Each folder is stat'ed once through its DirEntry and the mtime is reused
+    for both sorting and display. With inode_order the stats are issued in
+    inode order, which keeps inode-table reads sequential on a cold cache.
+    """
+    with os.scandir(output_dir) as it:
+        entries = [entry for entry in it if entry.is_dir()]
+    if inode_order:
+        entries.sort(key=lambda entry: entry.inode())
+    return [(Path(entry.path), entry.stat().st_mtime) for entry in entries]
+
+def _list_projects(output_dir):
+    """List project folders as (path, mtime) pairs, newest first."""
+    projects = _stat_projects(output_dir)
+    projects.sort(key=lambda item: item[1], reverse=True)
+    return projects
+
+def _recent_projects(output_dir, limit):
+    """Return the newest `limit` projects and the total project count.
+    
+    A heap picks the top entries and the scan skips the inode sort, so the
+    full list is never sorted.
+    """
+    projects = _stat_projects(output_dir, inode_order=False)
+    return heapq.nlargest(limit, projects, key=lambda item: item[1]), len(projects)
+
+def _scan_project(root):
+    """Walk a project once, returning (file_count, image_count, script_count, total_size)."""
+    files = images = scripts = size = 0
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    files += 1
+                    size += entry.stat().st_size
+                    name = entry.name
+                    dot = name.rfind('.')
+                    if dot >= 0 and name[dot:].lower() in _IMG_EXTS:
+                        images += 1
+                    if name == 'script.txt':
+                        scripts += 1
+    return files, images, scripts, size
+
+# Per-project stats cache kept in the output directory, keyed by project name
+_STATS_INDEX = '.aiva_stats.json'
+
+def _project_fingerprint(project):
+    """Latest mtime (ns) of a project folder and its immediate subfolders.
+    
+    Files live in the segment folders, so adding, removing or atomically
+    replacing one moves that folder's mtime.
+    """
+    latest = os.stat(project).st_mtime_ns
+    with os.scandir(project) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                latest = max(latest, entry.stat(follow_symlinks=False).st_mtime_ns)
+    return latest
+
+def _load_stats_index(output_dir):
+    """Load the cached project stats, or an empty index if missing or unreadable."""
+    try:
+        with open(output_dir / _STATS_INDEX, 'r') as f:
+            index = json.load(f)
+        return index if isinstance(index, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def _save_stats_index(output_dir, index):
+    """Persist the project stats cache; failures only cost a rescan next time."""
+    # Write a sibling and swap it in, so an interrupted save never leaves a
+    # truncated index behind
+    target = output_dir / _STATS_INDEX
+    tmp = target.with_name(target.name + '.tmp')
+    try:
+        with open(tmp, 'w') as f:
+            json.dump(index, f)
+        os.replace(tmp, target)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+def _cached_project_stats(project, index, updated):
+    """Return _scan_project() results, rescanning only projects that changed."""
+    fingerprint = _project_fingerprint(project)
+    entry = index.get(project.name)
+    if not (isinstance(entry, dict) and entry.get('fingerprint') == fingerprint):
+        entry = {'fingerprint': fingerprint, 'stats': list(_scan_project(project))}
+    updated[project.name] = entry
+    return tuple(entry['stats'])
+
+# Entries kept by each manifest cache; well above the ten projects a listing shows
+_MANIFEST_CACHE_SIZE = 128
+
+@functools.lru_cache(maxsize=_MANIFEST_CACHE_SIZE)
+def _load_manifest(path_str, mtime_ns):
+    """Parse a manifest.json; mtime_ns keys the cache to the file version."""
+    data = Path(path_str).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Project folders known to have no manifest, mapped to the folder mtime when
+# checked; least recently used first, trimmed to _MANIFEST_CACHE_SIZE entries
+_NO_MANIFEST = collections.OrderedDict()
+
+# Project folders the selector has listed, mapped to the folder mtime then;
+# a folder missing here (or changed since) still needs a cold manifest read
+_LISTED_PROJECTS = collections.OrderedDict()
+
+def _remember(cache, key, mtime):
+    """Record key's mtime in an LRU-ordered cache trimmed to _MANIFEST_CACHE_SIZE."""
+    cache[key] = mtime
+    cache.move_to_end(key)
+    if len(cache) > _MANIFEST_CACHE_SIZE:
+        cache.popitem(last=False)
+
+def _read_manifest(project, project_mtime=None):
+    """Return the project's parsed manifest, or None if it has none.
+    
+    When the caller already knows the folder's mtime, a missing manifest is
+    remembered until the folder changes, since creating the file updates it.
+    """
+    key = str(project)
+    if project_mtime is not None and _NO_MANIFEST.get(key) == project_mtime:
+        _NO_MANIFEST.move_to_end(key)
+        return None
+    manifest_file = project / "manifest.json"
+    try:
+        mtime_ns = manifest_file.stat().st_mtime_ns
+    except OSError:
+        if project_mtime is not None:
+            _remember(_NO_MANIFEST, key, project_mtime)
+        return None
+    _NO_MANIFEST.pop(key, None)
+    return _load_manifest(str(manifest_file), mtime_ns)
+
+def _manifest_topic(project, project_mtime=None):
+    """Return the topic recorded in a project's manifest, or None if unavailable."""
+    try:
+        manifest = _read_manifest(project, project_mtime)
+        if manifest and 'topic' in manifest:
+            return manifest['topic']
+    except Exception:
+        pass
+    return None
+
 def show_project_details(project):
     """Show detailed information about a specific project."""
-    print(f"\n📁 Project Details: {project.name}")
-    print("=" * 50)
+    lines = [f"\n📁 Project Details: {project.name}", "=" * 50]
     
     # Get project info
     mod_time = datetime.fromtimestamp(project.stat().st_mtime)
     
-    # Count files in project
-    all_files = list(project.rglob('*'))
-    file_count = sum(1 for f in all_files if f.is_file())
-    image_count = sum(1 for f in all_files if f.suffix.lower() in ['.png', '.jpg', '.jpeg'])
-    script_count = sum(1 for f in all_files if f.name == 'script.txt')
-    
-    # Calculate total size
-    total_size = sum(f.stat().st_size for f in all_files if f.is_file())
+    # Count files and total size in one walk
+    file_count, image_count, script_count, total_size = _scan_project(project)
     size_mb = total_size / (1024 * 1024)
     
-    print(f"📅 Created: {mod_time.strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"📄 Total Files: {file_count}")
-    print(f"🖼️  Images: {image_count}")
-    print(f"📝 Scripts: {script_count}")
-    print(f"💾 Size: {size_mb:.1f} MB")
-    print(f"📍 Path: {project}")
+    lines.append(f"📅 Created: {mod_time.strftime('%Y-%m-%d %H:%M:%S')}")
+    lines.append(f"📄 Total Files: {file_count}")
+    lines.append(f"🖼️  Images: {image_count}")
+    lines.append(f"📝 Scripts: {script_count}")
+    lines.append(f"💾 Size: {size_mb:.1f} MB")
+    lines.append(f"📍 Path: {project}")
     
     # Check for manifest file
-    manifest_file = project / "manifest.json"
-    if manifest_file.exists():
-        try:
-            with open(manifest_file, 'r') as f:
-                manifest = json.load(f)
-                print(f"\n📋 Manifest Information:")
-                if 'topic' in manifest:
-                    print(f"  🎯 Topic: {manifest['topic']}")
-                if 'title' in manifest:
-                    print(f"  📰 Title: {manifest['title']}")
-                if 'video_type' in manifest:
-                    print(f"  🎬 Type: {manifest['video_type']}")
-                if 'segments_count' in manifest:
-                    print(f"  🎞️  Segments: {manifest['segments_count']}")
-                if 'generation_time' in manifest:
-                    print(f"  ⏱️  Generation Time: {manifest['generation_time']}s")
-        except Exception as e:
-            print(f"  ⚠️  Error reading manifest: {e}")
+    try:
+        manifest = _read_manifest(project)
+    except Exception as e:
+        lines.append(f"  ⚠️  Error reading manifest: {e}")
+        manifest = None
+    if manifest is not None:
+        lines.append(f"\n📋 Manifest Information:")
+        if 'topic' in manifest:
+            lines.append(f"  🎯 Topic: {manifest['topic']}")
+        if 'title' in manifest:
+            lines.append(f"  📰 Title: {manifest['title']}")
+        if 'video_type' in manifest:
+            lines.append(f"  🎬 Type: {manifest['video_type']}")
+        if 'segments_count' in manifest:
+            lines.append(f"  🎞️  Segments: {manifest['segments_count']}")
+        if 'generation_time' in manifest:
+            lines.append(f"  ⏱️  Generation Time: {manifest['generation_time']}s")
     
     # Show segment structure
-    segments = [d for d in project.iterdir() if d.is_dir() and d.name.startswith('segment_')]
+    # DirEntry.is_dir() uses the type returned by the directory read, so no stat per entry
+    with os.scandir(project) as entries:
+        segments = [entry for entry in entries
+                    if entry.name.startswith('segment_') and entry.is_dir()]
     if segments:
         segments.sort(key=lambda x: int(x.name.split('_')[1]))
-        print(f"\n🎞️  Segments ({len(segments)} total):")
+        lines.append(f"\n🎞️  Segments ({len(segments)} total):")
         for i, segment in enumerate(segments[:5], 1):  # Show first 5 segments
-            segment_files = list(segment.iterdir())
-            has_image = any(f.suffix.lower() in ['.png', '.jpg', '.jpeg'] for f in segment_files)
-            has_script = any(f.name == 'script.txt' for f in segment_files)
-            has_prompt = any(f.name == 'prompt.txt' for f in segment_files)
+            segment_files = os.listdir(segment.path)
+            has_image = any(name[name.rfind('.'):].lower() in _IMG_EXTS
+                            for name in segment_files if '.' in name)
+            has_script = 'script.txt' in segment_files
+            has_prompt = 'prompt.txt' in segment_files
             
             status_icons = []
             if has_script: status_icons.append('📝')
             if has_prompt: status_icons.append('💭')
             if has_image: status_icons.append('🖼️')
             
-            print(f"  {segment.name}: {' '.join(status_icons) if status_icons else '❌'}")
+            lines.append(f"  {segment.name}: {' '.join(status_icons) if status_icons else '❌'}")
         
         if len(segments) > 5:
-            print(f"  ... and {len(segments) - 5} more segments")
+            lines.append(f"  ... and {len(segments) - 5} more segments")
+    
+    _write_lines(lines)
 
 def list_recent_projects():
     """List recent projects with enhanced selection."""
@@ -330,34 +577,35 @@ def list_recent_projects():
     elif selected_project == 'all':
         # Show all projects with basic info
         output_dir = project_root / "output"
-        projects = [d for d in output_dir.iterdir() if d.is_dir()]
-        projects.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+        projects = _list_projects(output_dir)
         
         print(f"\n📊 All Projects ({len(projects)} total):\n")
         
-        for i, project in enumerate(projects, 1):
-            mod_time = datetime.fromtimestamp(project.stat().st_mtime)
-            all_files = list(project.rglob('*'))
-            file_count = sum(1 for f in all_files if f.is_file())
-            image_count = sum(1 for f in all_files if f.suffix.lower() in ['.png', '.jpg', '.jpeg'])
-            total_size = sum(f.stat().st_size for f in all_files if f.is_file())
+        stats_index = _load_stats_index(output_dir)
+        updated_index = {}
+        
+        for i, (project, mtime) in enumerate(projects, 1):
+            mod_time = datetime.fromtimestamp(mtime)
+            file_count, image_count, _, total_size = _cached_project_stats(project, stats_index, updated_index)
             size_mb = total_size / (1024 * 1024)
             
-            print(f"{i:2d}. 📁 {project.name}")
-            print(f"    📅 {mod_time.strftime('%Y-%m-%d %H:%M:%S')}")
-            print(f"    📄 {file_count} files ({image_count} images) - {size_mb:.1f} MB")
+            lines = [
+                f"{i:2d}. 📁 {project.name}",
+                f"    📅 {mod_time.strftime('%Y-%m-%d %H:%M:%S')}",
+                f"    📄 {file_count} files ({image_count} images) - {size_mb:.1f} MB",
+            ]
             
             # Show topic if available
-            manifest_file = project / "manifest.json"
-            if manifest_file.exists():
-                try:
-                    with open(manifest_file, 'r') as f:
-                        manifest = json.load(f)
-                        if 'topic' in manifest:
-                            print(f"    🎯 {manifest['topic']}")
-                except:
-                    pass
-            print()
+            topic = _manifest_topic(project, mtime)
+            if topic is not None:
+                lines.append(f"    🎯 {topic}")
+            lines.append("")
+            
+            # One write per project keeps output flowing while uncached projects are scanned
+            _write_lines(lines)
+        
+        if updated_index != stats_index:
+            _save_stats_index(output_dir, updated_index)
     else:
         # Show detailed info for selected project
         show_project_details(selected_project)
@@ -367,11 +615,15 @@ def list_recent_projects():
             action = input("\n👉 Open project folder? (y/N): ").strip().lower()
             if action in ['y', 'yes']:
                 try:
-                    subprocess.run(['open', str(selected_project)], check=True)
+                    # Fire and forget so the menu does not wait on Finder
+                    subprocess.Popen(
+                        ['open', str(selected_project)],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        start_new_session=True,
+                    )
                     print("✅ Project folder opened in Finder")
-                except subprocess.CalledProcessError:
-                    print(f"📍 Project location: {selected_project}")
-                except FileNotFoundError:
+                except OSError:
                     print(f"📍 Project location: {selected_project}")
                 break
             elif action in ['n', 'no', '']:
@@ -379,19 +631,19 @@ def list_recent_projects():
             else:
                 print("❌ Please enter 'y' for yes or 'n' for no")
 
+_CONFIG_OPTIONS = (
+    ("check", "🔍 Check Current Configuration"),
+    ("edit", "✏️  Edit Configuration File"),
+    ("test", "🧪 Test API Connection"),
+    ("reset", "🔄 Reset to Default Settings"),
+)
+
 def configuration_menu():
     """Interactive configuration menu."""
-    config_options = [
-        ("check", "🔍 Check Current Configuration"),
-        ("edit", "✏️  Edit Configuration File"),
-        ("test", "🧪 Test API Connection"),
-        ("reset", "🔄 Reset to Default Settings")
-    ]
-    
     print("\n🔧 Configuration Options:")
     print("-" * 30)
     
-    for i, (key, description) in enumerate(config_options, 1):
+    for i, (key, description) in enumerate(_CONFIG_OPTIONS, 1):
         print(f"{i}. {description}")
     
     while True:
@@ -404,11 +656,27 @@ def configuration_menu():
             return 'test'
         elif choice == '4' or choice == 'reset':
             return 'reset'
-        elif choice == 'b' or choice == 'back':
+        elif choice in _BACK_KEYS:
             return None
         else:
             print("❌ Please choose 1-4 or 'b' to go back")
 
+@functools.lru_cache(maxsize=4)
+def _parse_env(path_str, mtime_ns):
+    """Parse KEY=value lines of an env file; mtime_ns keys the cache to the file version."""
+    with open(path_str, 'r') as f:
+        lines = f.read().splitlines()
+    env = {}
+    for line in lines:
+        if line and not line.startswith('#') and '=' in line:
+            key, value = line.split('=', 1)
+            env[key.strip()] = value.strip()
+    return env
+
+def _read_env(env_file):
+    """Return the parsed env file, re-reading it only after it changes."""
+    return _parse_env(str(env_file), env_file.stat().st_mtime_ns)
+
 def test_api_connection():
     """Test API connection with detailed feedback."""
     print("\n🧪 Testing API Connection")
@@ -422,15 +690,8 @@ def test_api_connection():
         return
     
     try:
-        with open(env_file, 'r') as f:
-            content = f.read()
-            
         # Extract API key
-        api_key = None
-        for line in content.split('\n'):
-            if line.startswith('GEMINI_API_KEY='):
-                api_key = line.split('=', 1)[1].strip()
-                break
+        api_key = _read_env(env_file).get('GEMINI_API_KEY')
         
         if not api_key or api_key == 'your_api_key_here':
             print("❌ API key not configured")
@@ -481,7 +742,6 @@ def edit_configuration():
         if create in ['y', 'yes']:
             template_file = project_root / "aiva_cli" / "config" / ".env.template"
             if template_file.exists():
-                import shutil
                 shutil.copy2(template_file, env_file)
                 print(f"✅ Created .env file from template")
             else:
@@ -492,8 +752,8 @@ def edit_configuration():
     
     print(f"📍 Configuration file: {env_file}")
     
-    # Try to open with system editor
-    editors = ['code', 'nano', 'vim', 'open']
+    # Try to open with system editor; a PATH lookup skips editors that are not installed
+    editors = [e for e in ('code', 'nano', 'vim', 'open') if shutil.which(e)]
     
     for editor in editors:
         try:
@@ -524,8 +784,11 @@ def reset_configuration():
     
     try:
         if template_file.exists():
-            import shutil
             shutil.copy2(template_file, env_file)
+            # Re-probe dependencies on the next status check
+            _probe.cache_clear()
+            _is_installed.cache_clear()
+            _missing_dependencies.cache_clear()
             print("✅ Configuration reset to defaults")
             print("💡 Please edit the .env file and add your API key")
         else:
@@ -567,33 +830,24 @@ def check_basic_configuration():
         
         # Check for API key (without revealing it)
         try:
-            with open(env_file, 'r') as f:
-                content = f.read()
-                if 'GEMINI_API_KEY' in content and '=' in content:
-                    # Check if there's a value after the equals sign
-                    for line in content.split('\n'):
-                        if line.startswith('GEMINI_API_KEY='):
-                            key_value = line.split('=', 1)[1].strip()
-                            if key_value and key_value != 'your_api_key_here':
-                                print("✅ Gemini API key configured")
-                                # Test API key validity
-                                try:
-                                    import google.generativeai as genai
-                                    genai.configure(api_key=key_value)
-                                    models = list(genai.list_models())
-                                    print("✅ API key is valid and working")
-                                except ImportError:
-                                    print("⚠️  Cannot test API key - google.generativeai not installed")
-                                except Exception as e:
-                                    print(f"⚠️  API key configured but may be invalid: {str(e)[:50]}...")
-                            else:
-                                print("❌ Gemini API key not set or using placeholder")
-                                print("💡 Edit aiva_cli/config/.env and add your API key")
-                            break
-                    else:
-                        print("❌ GEMINI_API_KEY not found in .env file")
-                else:
-                    print("❌ GEMINI_API_KEY not found in .env file")
+            key_value = _read_env(env_file).get('GEMINI_API_KEY')
+            if key_value is None:
+                print("❌ GEMINI_API_KEY not found in .env file")
+            elif key_value and key_value != 'your_api_key_here':
+                print("✅ Gemini API key configured")
+                # Test API key validity
+                try:
+                    import google.generativeai as genai
+                    genai.configure(api_key=key_value)
+                    models = list(genai.list_models())
+                    print("✅ API key is valid and working")
+                except ImportError:
+                    print("⚠️  Cannot test API key - google.generativeai not installed")
+                except Exception as e:
+                    print(f"⚠️  API key configured but may be invalid: {str(e)[:50]}...")
+            else:
+                print("❌ Gemini API key not set or using placeholder")
+                print("💡 Edit aiva_cli/config/.env and add your API key")
         except Exception as e:
             print(f"❌ Error reading .env file: {e}")
     else:
@@ -617,13 +871,15 @@ def check_basic_configuration():
     output_dir = project_root / "output"
     if output_dir.exists():
         print("✅ Output directory exists")
-        project_count = len([d for d in output_dir.iterdir() if d.is_dir()])
+        with os.scandir(output_dir) as entries:
+            project_count = sum(1 for entry in entries if entry.is_dir())
         print(f"📊 Contains {project_count} project(s)")
     else:
         print("⚠️  Output directory will be created when needed")
     
     # Check if AIVA CLI module can be imported
     try:
+        _ensure_on_path()
         import aiva_cli.cli
         print("✅ AIVA CLI module can be imported")
     except ImportError as e:
@@ -632,18 +888,17 @@ def check_basic_configuration():
 
 def view_system_status():
     """View system status and dependencies."""
-    print("\n📊 System Status")
-    print("=" * 25)
+    lines = ["\n📊 System Status", "=" * 25]
     
     # Python version
-    print(f"\n🐍 Python Version: {sys.version.split()[0]}")
+    lines.append(f"\n🐍 Python Version: {sys.version.split()[0]}")
     
     # Check if we're in a conda environment
     conda_env = os.environ.get('CONDA_DEFAULT_ENV')
     if conda_env:
-        print(f"🐍 Conda Environment: {conda_env}")
+        lines.append(f"🐍 Conda Environment: {conda_env}")
     else:
-        print("🐍 Conda Environment: Not detected")
+        lines.append("🐍 Conda Environment: Not detected")
     
     # Check dependencies
     dependencies = [
@@ -656,23 +911,23 @@ def view_system_status():
         ('requests', 'Requests (HTTP client)')
     ]
     
-    print("\n📦 Dependencies:")
+    lines.append("\n📦 Dependencies:")
     missing_deps = []
     for dep_module, dep_name in dependencies:
-        try:
-            module = __import__(dep_module)
+        module = _probe(dep_module)
+        if module is not None:
             version = getattr(module, '__version__', 'unknown')
-            print(f"✅ {dep_name} ({version})")
-        except ImportError:
-            print(f"❌ {dep_name} (not installed)")
+            lines.append(f"✅ {dep_name} ({version})")
+        else:
+            lines.append(f"❌ {dep_name} (not installed)")
             missing_deps.append(dep_name)
     
     if missing_deps:
-        print(f"\n⚠️  Missing {len(missing_deps)} dependencies")
-        print("💡 Check README_CLI.md for installation instructions")
+        lines.append(f"\n⚠️  Missing {len(missing_deps)} dependencies")
+        lines.append("💡 Check README_CLI.md for installation instructions")
     
     # Check project structure
-    print("\n📁 Project Structure:")
+    lines.append("\n📁 Project Structure:")
     important_paths = [
         ("aiva_cli/", "Main package directory"),
         ("aiva_cli/cli.py", "CLI entry point"),
@@ -686,21 +941,23 @@ def view_system_status():
     for path, description in important_paths:
         full_path = project_root / path
         if full_path.exists():
-            print(f"✅ {path} - {description}")
+            lines.append(f"✅ {path} - {description}")
         else:
-            print(f"❌ {path} - {description} (missing)")
+            lines.append(f"❌ {path} - {description} (missing)")
     
     # Memory and disk usage
-    print("\n💾 System Resources:")
+    lines.append("\n💾 System Resources:")
     try:
         import psutil
         memory = psutil.virtual_memory()
         disk = psutil.disk_usage('.')
-        print(f"🧠 Memory: {memory.percent}% used ({memory.available // (1024**3)} GB available)")
-        print(f"💿 Disk: {disk.percent}% used ({disk.free // (1024**3)} GB available)")
+        lines.append(f"🧠 Memory: {memory.percent}% used ({memory.available // (1024**3)} GB available)")
+        lines.append(f"💿 Disk: {disk.percent}% used ({disk.free // (1024**3)} GB available)")
     except ImportError:
-        print("⚠️  psutil not installed - cannot show system resource info")
-        print("💡 Install psutil for detailed system info")
+        lines.append("⚠️  psutil not installed - cannot show system resource info")
+        lines.append("💡 Install psutil for detailed system info")
+    
+    _write_lines(lines)
 
 def show_help():
     """Show help and documentation."""
@@ -769,32 +1026,116 @@ def show_help():
     
     print(help_text)
 
-def get_key():
-    """Get a single keypress from stdin with improved arrow key detection."""
+@contextlib.contextmanager
+def _cbreak_tty():
+    """Keep stdin in cbreak mode for the whole block.
+    
+    Yields (fd, saved_settings) so callers can temporarily restore the
+    terminal's normal mode; the original settings are restored on exit.
+    """
+    # POSIX-only terminal modules, needed only by the arrow-key menu
+    import termios
+    import tty
+    
+    fd = sys.stdin.fileno()
+    saved = termios.tcgetattr(fd)
+    tty.setcbreak(fd)
     try:
-        fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
-        try:
-            tty.setraw(sys.stdin.fileno())
-            key = sys.stdin.read(1)
-            
-            # Handle escape sequences (arrow keys)
-            if key == '\x1b':  # ESC sequence
-                # Check if more characters are available
-                if select.select([sys.stdin], [], [], 0.1)[0]:
-                    key += sys.stdin.read(1)
-                    if select.select([sys.stdin], [], [], 0.1)[0]:
-                        key += sys.stdin.read(1)
-                else:
-                    # Just ESC key pressed
-                    return key
-            
-            return key
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-    except Exception as e:
-        # Fallback for systems without termios
-        raise Exception("Terminal input not supported")
+        yield fd, saved
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+
+@contextlib.contextmanager
+def _cooked_tty(tty_state):
+    """Restore normal line input (echo, editing) for the block; no-op without a tty."""
+    if tty_state is None:
+        yield
+        return
+    
+    import termios
+    import tty
+    
+    fd, saved = tty_state
+    termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+    try:
+        yield
+    finally:
+        tty.setcbreak(fd)
+
+# One key per match: a CSI/SS3 escape sequence (arrows send these), a lone ESC,
+# or any other single character
+_KEY_PATTERN = re.compile(r'\x1b\[[0-9;]*[@-~]|\x1bO.|.', re.DOTALL)
+
+def read_keys(fd, decoder):
+    """Read the pending input burst and split it into individual keypresses.
+    
+    Keys typed quickly or pasted (e.g. an arrow then Enter) arrive in one read;
+    the incremental decoder carries a multi-byte character split across reads.
+    """
+    import select
+    
+    data = os.read(fd, 64)
+    if not data:
+        return ['']
+    # Wait briefly for the rest of an escape sequence cut off after ESC
+    if data.endswith(b'\x1b') and select.select([fd], [], [], 0.1)[0]:
+        data += os.read(fd, 64)
+    return _KEY_PATTERN.findall(decoder.decode(data))
+
+def _wait_for_key(fd, timeout):
+    """Discard keys queued while a message was shown, then wait up to timeout for a new one."""
+    import select
+    
+    while select.select([fd], [], [], 0)[0]:
+        if not os.read(fd, 64):
+            return  # EOF stays readable forever; the next read_keys reports it
+    select.select([fd], [], [], timeout)
+
+_ARROW_STEPS = {'\x1b[A': -1, '\x1b[B': 1}
+
+# Typed answers accepted by the menu and project prompts
+_DIGIT_KEYS = frozenset('123456')
+_QUIT_KEYS = frozenset({'q', 'quit', 'exit'})
+_ALL_KEYS = frozenset({'a', 'all'})
+_BACK_KEYS = frozenset({'b', 'back'})
+
+_GOODBYE_LINES = ("\n👋 Thank you for using AIVA CLI!", "🎬 Happy video creating! ✨")
+_INVALID_KEY_LINES = ("\n❌ Invalid key. Use ↑/↓ arrows, Enter, 1-6, or 'q'",)
+_CONTINUE_PROMPT = "\n⏸️  Press Enter to continue..."
+_ARROWS_UNSUPPORTED = "\n⚠️  Arrow keys not supported on this terminal"
+_FALLBACK_PROMPT = "👉 Enter choice (1-6) or 'q' to quit: "
+_INVALID_CHOICE = "\n❌ Invalid option. Please choose 1-6 or 'q' to quit."
+
+# Menu index for each single-key choice; None selects the highlighted entry.
+# read_keys returns '' at EOF (stdin closed), which exits like 'q'.
+_KEY_CHOICES = {
+    '\r': None,
+    '\n': None,
+    **{str(n): n - 1 for n in range(1, 7)},
+    'q': 5,
+    'Q': 5,
+    '': 5,
+}
+
+def _fallback_menu_choice(menu_functions):
+    """Prompt for a typed menu choice where arrow keys are unavailable; True means exit."""
+    print(_ARROWS_UNSUPPORTED)
+    choice = input(_FALLBACK_PROMPT).strip().lower()
+    
+    if choice in _DIGIT_KEYS:
+        choice_num = int(choice) - 1
+        if choice_num == 5:  # Exit
+            _write_lines(_GOODBYE_LINES)
+            return True
+        menu_functions[choice_num]()
+        input(_CONTINUE_PROMPT)
+    elif choice in _QUIT_KEYS:
+        _write_lines(_GOODBYE_LINES)
+        return True
+    else:
+        print(_INVALID_CHOICE)
+        input(_CONTINUE_PROMPT)
+    return False
 
 def interactive_menu():
     """Interactive menu with arrow key navigation."""
@@ -808,84 +1149,86 @@ def interactive_menu():
         lambda: None  # Exit function
     ]
     
-    while True:
-        clear_screen()
-        print_banner()
-        show_menu(selected_index)
-        
-        print("\n💡 Navigation: ↑/↓ arrows, Enter to select, 'q' to quit, or type 1-6")
+    with contextlib.ExitStack() as stack:
+        # Switch the terminal mode once for the whole menu, not per keypress
+        tty_state = None
+        if _is_tty():
+            try:
+                tty_state = stack.enter_context(_cbreak_tty())
+            except Exception:
+                pass
         
-        try:
-            # Get key input without showing prompt
-            key = get_key()
+        pending_keys = collections.deque()
+        decoder = codecs.getincrementaldecoder('utf-8')('replace')
+        redraw = True
+        while True:
+            # Arrow keys patch the highlighted line; everything else repaints
+            if redraw:
+                clear_screen()
+                print_banner()
+                show_menu(selected_index)
+                
+                print("\n💡 Navigation: ↑/↓ arrows, Enter to select, 'q' to quit, or type 1-6")
+            redraw = True
             
-            # Handle arrow keys
-            if key == '\x1b[A':  # Up arrow
-                selected_index = (selected_index - 1) % 6
-                continue
-            elif key == '\x1b[B':  # Down arrow
-                selected_index = (selected_index + 1) % 6
-                continue
-            elif key == '\r' or key == '\n':  # Enter
-                if selected_index == 5:  # Exit
-                    print("\n👋 Thank you for using AIVA CLI!")
-                    print("🎬 Happy video creating! ✨")
-                    break
-                else:
-                    menu_functions[selected_index]()
-                    input("\n⏸️  Press Enter to continue...")
+            try:
+                if tty_state is None:
+                    # No cbreak terminal: fall back to typed line input
+                    if _fallback_menu_choice(menu_functions):
+                        break
                     continue
-            
-            # Handle direct number input
-            elif key in ['1', '2', '3', '4', '5', '6']:
-                choice_num = int(key) - 1
-                if choice_num == 5:  # Exit
-                    print("\n👋 Thank you for using AIVA CLI!")
-                    print("🎬 Happy video creating! ✨")
-                    break
-                else:
-                    menu_functions[choice_num]()
-                    input("\n⏸️  Press Enter to continue...")
-            
-            # Handle quit command
-            elif key.lower() in ['q']:
-                print("\n👋 Thank you for using AIVA CLI!")
-                print("🎬 Happy video creating! ✨")
-                break
-            
-            # Handle escape key
-            elif key == '\x1b':
-                continue
-            
-            else:
-                # For other keys, show error briefly
-                print(f"\n❌ Invalid key. Use ↑/↓ arrows, Enter, 1-6, or 'q'")
-                time.sleep(1)
                 
-        except KeyboardInterrupt:
-            print("\n\n👋 Goodbye! Thanks for using AIVA CLI!")
-            break
-        except Exception as e:
-            # Fallback to traditional input method
-            print("\n⚠️  Arrow keys not supported on this terminal")
-            choice = input("👉 Enter choice (1-6) or 'q' to quit: ").strip().lower()
-            
-            if choice in ['1', '2', '3', '4', '5', '6']:
-                choice_num = int(choice) - 1
+                # Get key input without showing prompt, one keypress at a time
+                try:
+                    while not pending_keys:
+                        pending_keys.extend(read_keys(tty_state[0], decoder))
+                except OSError:
+                    # The terminal stopped delivering keys; restore it and use typed input
+                    stack.close()
+                    tty_state = None
+                    continue
+                key = pending_keys.popleft()
+                
+                # Handle arrow keys; a burst of repeats moves once to the final entry
+                delta = _ARROW_STEPS.get(key)
+                if delta is not None:
+                    while pending_keys and pending_keys[0] in _ARROW_STEPS:
+                        delta += _ARROW_STEPS[pending_keys.popleft()]
+                    new_index = (selected_index + delta) % 6
+                    if new_index != selected_index:
+                        _update_selection(selected_index, new_index)
+                        selected_index = new_index
+                    redraw = False
+                    continue
+                
+                # Handle escape key
+                if key == '\x1b':
+                    redraw = False
+                    continue
+                
+                # Enter, a number or 'q' resolve to a menu entry in one lookup
+                if key not in _KEY_CHOICES:
+                    # For other keys, show error briefly
+                    _write_lines(_INVALID_KEY_LINES)
+                    pending_keys.clear()
+                    _wait_for_key(tty_state[0], 1.0)
+                    continue
+                
+                choice_num = _KEY_CHOICES[key]
+                if choice_num is None:  # Enter
+                    choice_num = selected_index
                 if choice_num == 5:  # Exit
-                    print("\n👋 Thank you for using AIVA CLI!")
-                    print("🎬 Happy video creating! ✨")
+                    _write_lines(_GOODBYE_LINES)
                     break
-                else:
+                # Keys typed ahead of the menu action are not replayed after it
+                pending_keys.clear()
+                with _cooked_tty(tty_state):
                     menu_functions[choice_num]()
-                    input("\n⏸️  Press Enter to continue...")
-            elif choice in ['q', 'quit', 'exit']:
-                print("\n👋 Thank you for using AIVA CLI!")
-                print("🎬 Happy video creating! ✨")
+                    input(_CONTINUE_PROMPT)
+                    
+            except KeyboardInterrupt:
+                print("\n\n👋 Goodbye! Thanks for using AIVA CLI!")
                 break
-            else:
-                print("\n❌ Invalid option. Please choose 1-6 or 'q' to quit.")
-                input("\n⏸️  Press Enter to continue...")
 
 def enhanced_project_selector():
     """Enhanced project selection with better navigation."""
@@ -896,47 +1239,52 @@ def enhanced_project_selector():
         print("💡 Generate some content first!")
         return None
     
-    projects = [d for d in output_dir.iterdir() if d.is_dir()]
+    # The ten most recently modified projects, newest first
+    projects, total = _recent_projects(output_dir, 10)
     
     if not projects:
         print("\n📂 No projects found in output directory.")
         print("💡 Generate some content first!")
         return None
     
-    # Sort by modification time (newest first)
-    projects.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-    
-    print(f"\n📊 Found {len(projects)} project(s). Select one to view details:\n")
-    
-    for i, project in enumerate(projects[:10], 1):
-        mod_time = datetime.fromtimestamp(project.stat().st_mtime)
-        print(f"{i:2d}. 📁 {project.name}")
-        print(f"    📅 {mod_time.strftime('%Y-%m-%d %H:%M:%S')}")
+    lines = [f"\n📊 Found {total} project(s). Select one to view details:\n"]
+    
+    # Read manifests not listed before concurrently so slow or networked storage
+    # latencies overlap; repeat visits are served by the caches inline
+    cold = [(project, mtime) for project, mtime in projects
+            if _LISTED_PROJECTS.get(str(project)) != mtime]
+    topics = {}
+    if len(cold) > 1:
+        with ThreadPoolExecutor(max_workers=len(cold)) as executor:
+            topics = dict(zip((project for project, _ in cold),
+                              executor.map(_manifest_topic, *zip(*cold))))
+    
+    for i, (project, mtime) in enumerate(projects, 1):
+        topic = topics[project] if project in topics else _manifest_topic(project, mtime)
+        _remember(_LISTED_PROJECTS, str(project), mtime)
+        mod_time = datetime.fromtimestamp(mtime)
+        lines.append(f"{i:2d}. 📁 {project.name}")
+        lines.append(f"    📅 {mod_time.strftime('%Y-%m-%d %H:%M:%S')}")
         
         # Show topic if available
-        manifest_file = project / "manifest.json"
-        if manifest_file.exists():
-            try:
-                with open(manifest_file, 'r') as f:
-                    manifest = json.load(f)
-                    if 'topic' in manifest:
-                        print(f"    🎯 {manifest['topic']}")
-            except:
-                pass
-        print()
+        if topic is not None:
+            lines.append(f"    🎯 {topic}")
+        lines.append("")
+    
+    _write_lines(lines)
     
     while True:
         try:
             choice = input("\n👉 Select project number (1-10), 'a' for all details, or 'b' to go back: ").strip().lower()
             
-            if choice == 'b' or choice == 'back':
+            if choice in _BACK_KEYS:
                 return None
-            elif choice == 'a' or choice == 'all':
+            elif choice in _ALL_KEYS:
                 return 'all'
             elif choice.isdigit():
                 choice_num = int(choice)
                 if 1 <= choice_num <= min(10, len(projects)):
-                    return projects[choice_num - 1]
+                    return projects[choice_num - 1][0]
                 else:
                     print(f"\n❌ Please choose a number between 1 and {min(10, len(projects))}")
             else:
@@ -7,6 +7,8 @@ Demonstrates the core business logic components working together:
 - Output management
 """
 
+import functools
+import io
 import sys
 from pathlib import Path
 
@@ -14,19 +16,38 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from aiva_cli.core import (
-    segment_script, 
-    enhance_prompt, 
-    StylePreset,
-    create_project,
-    SegmentOutput
-)
+
+def _flush(buf):
+    """Write buffered demo output to stdout in one call and reset the buffer."""
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
+    buf.seek(0)
+    buf.truncate()
 
 
 def demo_phase4():
     """Demonstrate Phase 4 functionality."""
-    print("🎬 AIVA CLI Phase 4 Demo")
-    print("=" * 40)
+    buf = io.StringIO()
+    try:
+        return _demo_phase4(buf)
+    finally:
+        _flush(buf)
+
+
+def _demo_phase4(buf):
+    """Run the demo, writing its report to buf and flushing at step boundaries."""
+    # Imported here so the module loads without pulling in the model SDKs
+    from aiva_cli.core import (
+        segment_script,
+        enhance_prompt,
+        StylePreset,
+        create_project,
+        SegmentOutput
+    )
+    
+    emit = functools.partial(print, file=buf)
+    emit("🎬 AIVA CLI Phase 4 Demo")
+    emit("=" * 40)
     
     # Sample 5-minute script about AI
     sample_script = """
@@ -58,46 +79,52 @@ def demo_phase4():
     The key is ensuring that as we advance these technologies, we maintain human values and ethical principles at their core.
     """
     
-    print("\n📝 Step 1: Script Segmentation")
-    print("-" * 30)
+    emit("\n📝 Step 1: Script Segmentation")
+    emit("-" * 30)
     
     # Segment the script into 38 parts
     segments = segment_script(sample_script, target_segments=38, target_duration=8.0)
     
-    print(f"✅ Created {len(segments)} segments")
-    print(f"📊 Total duration: {sum(s.duration for s in segments):.1f} seconds")
-    print(f"📊 Average duration: {sum(s.duration for s in segments) / len(segments):.1f} seconds")
+    emit(f"✅ Created {len(segments)} segments")
+    emit(f"📊 Total duration: {sum(s.duration for s in segments):.1f} seconds")
+    emit(f"📊 Average duration: {sum(s.duration for s in segments) / len(segments):.1f} seconds")
     
     # Show first few segments
-    print("\n🔍 Sample segments:")
+    emit("\n🔍 Sample segments:")
     for i, segment in enumerate(segments[:3]):
-        print(f"   Segment {segment.index}: {segment.text[:60]}... ({segment.duration:.1f}s)")
+        emit(f"   Segment {segment.index}: {segment.text[:60]}... ({segment.duration:.1f}s)")
     
-    print("\n🎨 Step 2: Prompt Enhancement")
-    print("-" * 30)
+    _flush(buf)
+    
+    emit("\n🎨 Step 2: Prompt Enhancement")
+    emit("-" * 30)
     
     # Enhance prompts for first few segments
     enhanced_prompts = []
     styles = [StylePreset.CINEMATIC_4K, StylePreset.GOLDEN_HOUR, StylePreset.DRAMATIC_LIGHTING]
+    styles_len = len(styles)
+    demo_segments = segments[:6]  # First 6 segments, shared with Step 3
     
-    for i, segment in enumerate(segments[:6]):  # First 6 segments
+    for i, segment in enumerate(demo_segments):
         # Create basic visual description
         basic_desc = f"Scene showing {segment.text.split('.')[0].lower()}"
         
         # Enhance with rotating styles
-        style = styles[i % len(styles)]
+        style = styles[i % styles_len]
         enhanced = enhance_prompt(basic_desc, style.value)
         enhanced_prompts.append(enhanced)
         
         if i < 3:  # Show first 3
-            print(f"   Segment {i+1}:")
-            print(f"     Original: {basic_desc}")
-            print(f"     Enhanced: {enhanced[:80]}...")
-            print(f"     Style: {style.value}")
-            print()
+            emit(f"   Segment {i+1}:")
+            emit(f"     Original: {basic_desc}")
+            emit(f"     Enhanced: {enhanced[:80]}...")
+            emit(f"     Style: {style.value}")
+            emit()
+    
+    _flush(buf)
     
-    print("\n📁 Step 3: Output Management")
-    print("-" * 30)
+    emit("\n📁 Step 3: Output Management")
+    emit("-" * 30)
     
     # Create project structure
     manager = create_project(
@@ -116,11 +143,11 @@ def demo_phase4():
         }
     )
     
-    print(f"✅ Created project: {manager.current_project_dir.name}")
+    emit(f"✅ Created project: {manager.current_project_dir.name}")
     
     # Save first few segments
     saved_count = 0
-    for i, (segment, enhanced_prompt) in enumerate(zip(segments[:6], enhanced_prompts)):
+    for i, (segment, enhanced_prompt) in enumerate(zip(demo_segments, enhanced_prompts)):
         segment_output = SegmentOutput(
             segment_id=segment.index,
             text=segment.text,
@@ -134,10 +161,10 @@ def demo_phase4():
         saved_count += 1
         
         if i < 2:  # Show first 2
-            print(f"   Saved segment {segment.index}:")
-            print(f"     Text: {paths['text'].name}")
-            print(f"     Prompt: {paths['prompt'].name}")
-            print(f"     Metadata: {paths['metadata'].name}")
+            emit(f"   Saved segment {segment.index}:")
+            emit(f"     Text: {paths['text'].name}")
+            emit(f"     Prompt: {paths['prompt'].name}")
+            emit(f"     Metadata: {paths['metadata'].name}")
     
     # Update manifest
     manifest_path = manager.save_manifest({
@@ -146,32 +173,34 @@ def demo_phase4():
         "enhancement_styles": [s.value for s in styles]
     })
     
-    print(f"\n📋 Project Status:")
+    emit(f"\n📋 Project Status:")
     status = manager.get_project_status()
-    print(f"   Project ID: {status['project']['project_id'][:8]}...")
-    print(f"   Total segments: {status['project']['total_segments']}")
-    print(f"   Completed segments: {status['summary']['completed_segments']}")
-    print(f"   Pending segments: {status['summary']['pending_segments']}")
-    
-    print("\n🎯 Step 4: Integration Summary")
-    print("-" * 30)
-    print(f"✅ Script successfully segmented into {len(segments)} parts")
-    print(f"✅ {len(enhanced_prompts)} prompts enhanced with cinematic styles")
-    print(f"✅ Project structure created with {saved_count} segments saved")
-    print(f"✅ Manifest generated with complete metadata")
-    
-    print(f"\n📂 Output location: {manager.current_project_dir}")
-    print(f"📄 Manifest file: {manifest_path.name}")
-    
-    print("\n" + "=" * 40)
-    print("🎉 Phase 4 Demo Complete!")
-    print("\n🚀 Core business logic is fully operational:")
-    print("   • Script segmentation with precise timing")
-    print("   • Cinematic prompt enhancement with multiple styles")
-    print("   • Structured output management with metadata")
-    print("   • End-to-end pipeline integration")
-    
-    print("\n✅ Phase 4 complete, ready for Phase 5.")
+    emit(f"   Project ID: {status['project']['project_id'][:8]}...")
+    emit(f"   Total segments: {status['project']['total_segments']}")
+    emit(f"   Completed segments: {status['summary']['completed_segments']}")
+    emit(f"   Pending segments: {status['summary']['pending_segments']}")
+    
+    _flush(buf)
+    
+    emit("\n🎯 Step 4: Integration Summary")
+    emit("-" * 30)
+    emit(f"✅ Script successfully segmented into {len(segments)} parts")
+    emit(f"✅ {len(enhanced_prompts)} prompts enhanced with cinematic styles")
+    emit(f"✅ Project structure created with {saved_count} segments saved")
+    emit(f"✅ Manifest generated with complete metadata")
+    
+    emit(f"\n📂 Output location: {manager.current_project_dir}")
+    emit(f"📄 Manifest file: {manifest_path.name}")
+    
+    emit("\n" + "=" * 40)
+    emit("🎉 Phase 4 Demo Complete!")
+    emit("\n🚀 Core business logic is fully operational:")
+    emit("   • Script segmentation with precise timing")
+    emit("   • Cinematic prompt enhancement with multiple styles")
+    emit("   • Structured output management with metadata")
+    emit("   • End-to-end pipeline integration")
+    
+    emit("\n✅ Phase 4 complete, ready for Phase 5.")
     
     return manager
 
@@ -5,6 +5,8 @@ Pytest Configuration and Shared Fixtures
 Provides shared fixtures, configuration, and utilities for all test modules.
 """
 
+import functools
+import os
 import pytest
 import sys
 import tempfile
@@ -17,22 +19,19 @@ sys.path.insert(0, str(Path(__file__).parent.parent / 'aiva_cli'))
 
 # Mock external dependencies before any imports
 # Only mock if not already imported
-if 'google' not in sys.modules:
-    sys.modules['google'] = MagicMock()
-if 'google.generativeai' not in sys.modules:
-    sys.modules['google.generativeai'] = MagicMock()
-if 'google.genai' not in sys.modules:
-    sys.modules['google.genai'] = MagicMock()
-if 'google.genai.types' not in sys.modules:
-    sys.modules['google.genai.types'] = MagicMock()
-if 'crewai' not in sys.modules:
-    sys.modules['crewai'] = MagicMock()
-if 'crewai.agent' not in sys.modules:
-    sys.modules['crewai.agent'] = MagicMock()
-if 'crewai.crew' not in sys.modules:
-    sys.modules['crewai.crew'] = MagicMock()
-if 'crewai.task' not in sys.modules:
-    sys.modules['crewai.task'] = MagicMock()
+_MOCKED_MODULES = (
+    'google',
+    'google.generativeai',
+    'google.genai',
+    'google.genai.types',
+    'crewai',
+    'crewai.agent',
+    'crewai.crew',
+    'crewai.task',
+)
+for _module_name in _MOCKED_MODULES:
+    if _module_name not in sys.modules:
+        sys.modules[_module_name] = MagicMock()
 
 
 @pytest.fixture(scope="session")
@@ -52,6 +51,13 @@ def test_config():
     }
 
 
+@pytest.fixture(scope="session")
+def runner():
+    """CLI test runner shared by the whole session; CliRunner keeps no state between invokes."""
+    from typer.testing import CliRunner
+    return CliRunner()
+
+
 @pytest.fixture
 def mock_aiva_config():
     """Standard mock AIVA configuration for tests."""
@@ -66,6 +72,8 @@ def mock_aiva_config():
     config.script_length = 300
     config.segment_duration = 8
     config.max_retries = 3
+    config.circuit_breaker_threshold = 5
+    config.circuit_breaker_cooldown = 30.0
     config.output_dir = "test_output"
     
     # Mock model_dump for AIVASettings compatibility
@@ -170,6 +178,33 @@ def sample_video_types():
     ]
 
 
+@functools.lru_cache(maxsize=None)
+def _mock_segments(count):
+    """Build the formatted manifest segment entries once per segment count."""
+    return tuple(
+        {
+            "id": f"segment_{i:02d}",
+            "text": f"Segment {i} content",
+            "image_path": f"segment_{i:02d}/image.png",
+            "prompt": f"Visual prompt for segment {i}",
+            "status": "completed"
+        }
+        for i in range(1, count + 1)
+    )
+
+
+def _write_file(path, data):
+    """Write bytes to a file with raw os calls, skipping the buffered file object."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # os.write may write less than asked; keep going until everything is out
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
 class TestHelpers:
     """Helper utilities for tests."""
     
@@ -184,16 +219,8 @@ class TestHelpers:
                 "created_at": "2024-01-01T12:00:00Z",
                 "duration": segments * 8
             },
-            "segments": [
-                {
-                    "id": f"segment_{i:02d}",
-                    "text": f"Segment {i} content",
-                    "image_path": f"segment_{i:02d}/image.png",
-                    "prompt": f"Visual prompt for segment {i}",
-                    "status": "completed"
-                }
-                for i in range(1, segments + 1)
-            ],
+            # Fresh dicts per call so tests can mutate segments freely
+            "segments": [dict(segment) for segment in _mock_segments(segments)],
             "statistics": {
                 "total_segments": segments,
                 "success_rate": 1.0,
@@ -218,17 +245,18 @@ class TestHelpers:
         project_dir = workspace_path / "test_project"
         project_dir.mkdir(exist_ok=True)
         
-        for i in range(1, num_segments + 1):
-            segment_dir = project_dir / f"segment_{i:02d}"
-            segment_dir.mkdir(exist_ok=True)
+        # Build every path and payload up front, then do only the I/O
+        segment_dirs = [str(project_dir / f"segment_{i:02d}") for i in range(1, num_segments + 1)]
+        texts = [f"This is the content for segment {i}".encode() for i in range(1, num_segments + 1)]
+        
+        for segment_dir, text in zip(segment_dirs, texts):
+            os.makedirs(segment_dir, exist_ok=True)
             
             # Create text file
-            text_file = segment_dir / "text.txt"
-            text_file.write_text(f"This is the content for segment {i}")
+            _write_file(os.path.join(segment_dir, "text.txt"), text)
             
             # Create mock image file
-            image_file = segment_dir / "image.png"
-            image_file.write_bytes(b"fake_png_data")
+            _write_file(os.path.join(segment_dir, "image.png"), b"fake_png_data")
         
         return project_dir
     
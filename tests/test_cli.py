@@ -7,25 +7,42 @@ validation, and command execution.
 """
 
 import pytest
-import sys
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
-from typer.testing import CliRunner
-
-# Add the aiva_cli directory to the path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'aiva_cli'))
 
 from cli import app, generate, init, status
 
 
+# Plain values for every generate() parameter, chosen to skip interactive mode.
+# The real CLI defaults for video_type, verbose and dry_run are None, which
+# makes `aiva generate "topic"` prompt for them; these tests exercise only the
+# non-interactive path (test_generate_command_default_path covers the real
+# defaults). Calling the command function directly also skips Click's parsing,
+# so Typer's OptionInfo defaults would leak in unless every value is given.
+GENERATE_DEFAULTS = {
+    'topic': None,
+    'title': None,
+    'video_type': "long-form",
+    'output_dir': None,
+    'config_file': None,
+    'verbose': False,
+    'dry_run': False,
+    'interactive': False,
+}
+
+
+# One character past the assumed 100 character title limit
+_LONG_TITLE = "A" * 101
+
+
+def call_generate(**overrides):
+    """Invoke the generate command function directly with plain arguments."""
+    generate(**{**GENERATE_DEFAULTS, **overrides})
+
+
 class TestCLI:
     """Test cases for CLI functionality."""
     
-    @pytest.fixture
-    def runner(self):
-        """Create CLI test runner."""
-        return CliRunner()
-    
     @pytest.fixture
     def mock_config(self):
         """Mock configuration for testing."""
@@ -47,12 +64,25 @@ class TestCLI:
     
     @patch('cli.load_config')
     @patch('cli.generate_content')
-    def test_generate_command_basic(self, mock_generate, mock_load_config, runner):
+    def test_generate_command_basic(self, mock_generate, mock_load_config, capsys):
         """Test basic generate command."""
         mock_load_config.return_value = Mock()
         mock_generate.return_value = "test_output_dir"
         
-        result = runner.invoke(app, ["generate", "AI Revolution"])
+        call_generate(topic="AI Revolution")
+        
+        mock_generate.assert_called_once()
+        assert "Content generation completed" in capsys.readouterr().out
+    
+    @patch('cli.load_config')
+    @patch('cli.generate_content')
+    def test_generate_command_default_path(self, mock_generate, mock_load_config, runner):
+        """Test `aiva generate "topic"` with the real CLI defaults, answering its prompts."""
+        mock_load_config.return_value = Mock()
+        mock_generate.return_value = "test_output_dir"
+        
+        # No custom title, long-form video, default output dir, not verbose, no dry run
+        result = runner.invoke(app, ["generate", "AI Revolution"], input="n\n2\n1\nn\nn\n")
         
         assert result.exit_code == 0
         mock_generate.assert_called_once()
@@ -60,19 +90,18 @@ class TestCLI:
     
     @patch('cli.load_config')
     @patch('cli.generate_content')
-    def test_generate_command_with_options(self, mock_generate, mock_load_config, runner):
+    def test_generate_command_with_options(self, mock_generate, mock_load_config):
         """Test generate command with all options."""
         mock_load_config.return_value = Mock()
         mock_generate.return_value = "test_output_dir"
         
-        result = runner.invoke(app, [
-            "generate", "AI Revolution",
-            "--type", "educational",
-            "--output-dir", "custom_output",
-            "--title", "Custom AI Guide"
-        ])
+        call_generate(
+            topic="AI Revolution",
+            video_type="educational",
+            output_dir="custom_output",
+            title="Custom AI Guide"
+        )
         
-        assert result.exit_code == 0
         mock_generate.assert_called_once()
         
         # Check that the function was called with correct parameters
@@ -121,17 +150,13 @@ class TestCLI:
     
     @patch('cli.load_config')
     @patch('cli.generate_content')
-    def test_generate_command_dry_run(self, mock_generate, mock_load_config, runner):
+    def test_generate_command_dry_run(self, mock_generate, mock_load_config, capsys):
         """Test generate command with dry run option."""
         mock_load_config.return_value = Mock()
         
-        result = runner.invoke(app, [
-            "generate", "AI Revolution",
-            "--dry-run"
-        ])
+        call_generate(topic="AI Revolution", dry_run=True)
         
-        assert result.exit_code == 0
-        assert "DRY RUN MODE" in result.stdout
+        assert "DRY RUN MODE" in capsys.readouterr().out
         mock_generate.assert_not_called()
     
     @patch('cli.Path.exists')
@@ -201,14 +226,12 @@ class TestCLI:
     def test_generate_command_title_validation(self, runner):
         """Test generate command title validation."""
         # Test with very long title
-        long_title = "A" * 101  # Assuming 100 char limit
-        
         with patch('cli.load_config') as mock_load_config:
             mock_load_config.return_value = Mock()
             
             result = runner.invoke(app, [
                 "generate", "AI Revolution",
-                "--title", long_title
+                "--title", _LONG_TITLE
             ])
             
             # Should handle long titles gracefully
@@ -216,19 +239,15 @@ class TestCLI:
     
     @patch('cli.load_config')
     @patch('cli.generate_content')
-    def test_generate_command_verbose_output(self, mock_generate, mock_load_config, runner):
+    def test_generate_command_verbose_output(self, mock_generate, mock_load_config, capsys):
         """Test generate command with verbose output."""
         mock_load_config.return_value = Mock()
         mock_generate.return_value = "test_output_dir"
         
-        result = runner.invoke(app, [
-            "generate", "AI Revolution",
-            "--verbose"
-        ])
+        call_generate(topic="AI Revolution", verbose=True)
         
-        assert result.exit_code == 0
         # Verbose mode should show more detailed output
-        assert "Content generation completed" in result.stdout
+        assert "Content generation completed" in capsys.readouterr().out
 
 
 if __name__ == "__main__":
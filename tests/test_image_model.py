@@ -6,24 +6,71 @@ Tests the GeminiImageModel class with mocked HTTP requests to ensure
 proper functionality without making actual API calls.
 """
 
+import io
 import pytest
-import sys
-import tempfile
-import shutil
-from unittest.mock import Mock, patch, MagicMock, mock_open
+from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
+from types import SimpleNamespace
 
-# Mock the google.generativeai module before any imports
-mock_genai = MagicMock()
-sys.modules['google.generativeai'] = mock_genai
-sys.modules['google'] = MagicMock()
-sys.modules['google.generativeai'] = mock_genai
+from PIL import Image
 
-# Add the aiva_cli directory to the path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'aiva_cli'))
+from aiva_cli.models.image_model import GeminiImageModel, generate_image, reset_shared_clients, _GENAI_IMPORT_ERROR
+from aiva_cli.models._retry import sdk_installed
 
-# Now we can safely import our modules
-from models.image_model import GeminiImageModel, generate_image
+
+def _image_config():
+    """Build the mock configuration used to construct the image model."""
+    config = Mock()
+    config.gemini_api_key = "test_api_key"
+    config.models.image_model = "imagen-3.0-generate-001"
+    config.models.timeout = 60
+    config.output.image_format = "png"
+    config.max_retries = 3
+    config.circuit_breaker_threshold = 5
+    config.circuit_breaker_cooldown = 30.0
+    return config
+
+
+def _png_bytes():
+    """Encode a 1x1 PNG, the smallest payload the model can decode and re-save."""
+    buffer = io.BytesIO()
+    Image.new("RGB", (1, 1)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+_PNG_BYTES = _png_bytes()
+
+
+def _image_response(*image_bytes):
+    """Build a stub Imagen response carrying the given images, one PNG by default."""
+    if not image_bytes:
+        image_bytes = (_PNG_BYTES,)
+    return SimpleNamespace(generated_images=[
+        SimpleNamespace(image=SimpleNamespace(image_bytes=data)) for data in image_bytes
+    ])
+
+
+@pytest.fixture(scope="module")
+def genai_patch():
+    """Patch the SDK modules used by image_model once for every test in this module."""
+    genai_patcher = patch('aiva_cli.models.image_model.genai')
+    types_patcher = patch('aiva_cli.models.image_model.types')
+    mock = genai_patcher.start()
+    types_patcher.start()
+    # Clients cached by earlier tests were built from a different genai
+    reset_shared_clients()
+    yield mock
+    types_patcher.stop()
+    genai_patcher.stop()
+    reset_shared_clients()
+
+
+@pytest.fixture(scope="module")
+def shared_image_model(genai_patch):
+    """Construct one GeminiImageModel for the module; image_model resets it per test."""
+    with patch('aiva_cli.models.image_model.load_config', return_value=_image_config()), \
+         patch('aiva_cli.models.image_model.get_gemini_api_key', return_value="test_api_key"):
+        return GeminiImageModel()
 
 
 class TestGeminiImageModel:
@@ -32,50 +79,33 @@ class TestGeminiImageModel:
     @pytest.fixture
     def mock_config(self):
         """Mock configuration for testing."""
-        config = Mock()
-        config.gemini_api_key = "test_api_key"
-        config.models.image_model = "imagen-3.0-generate-001"
-        config.models.timeout = 60
-        config.max_retries = 3
-        return config
-    
-    @pytest.fixture
-    def mock_genai(self):
-        """Mock the google.generativeai module."""
-        with patch('aiva_cli.models.image_model.genai') as mock:
-            mock_model = Mock()
-            mock.GenerativeModel.return_value = mock_model
-            yield mock, mock_model
+        return _image_config()
     
     @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for testing."""
-        temp_dir = tempfile.mkdtemp()
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
+    def mock_genai(self, genai_patch):
+        """The module's genai patch, cleared of what earlier tests recorded or configured."""
+        genai_patch.reset_mock(return_value=True, side_effect=True)
+        reset_shared_clients()
+        return genai_patch
     
     @pytest.fixture
-    def image_model(self, mock_config, mock_genai):
+    def image_model(self, shared_image_model, mock_genai):
         """Create a GeminiImageModel instance for testing."""
-        mock_genai_module, mock_model = mock_genai
-        
-        with patch('aiva_cli.models.image_model.load_config', return_value=mock_config):
-            model = GeminiImageModel()
-            model.model = mock_model
-            return model
+        # Reuse the module's instance with a fresh client stub and a closed circuit
+        model = shared_image_model
+        model.client = Mock()
+        model._breaker.record_success()
+        return model
     
     def test_initialization_success(self, mock_config, mock_genai):
         """Test successful model initialization."""
-        mock_genai_module, mock_model = mock_genai
-        
-        with patch('aiva_cli.models.image_model.load_config', return_value=mock_config):
+        with patch('aiva_cli.models.image_model.load_config', return_value=mock_config), \
+             patch('aiva_cli.models.image_model.get_gemini_api_key', return_value="test_api_key"):
             model = GeminiImageModel()
             
-            # Verify API configuration
-            mock_genai_module.configure.assert_called_once_with(api_key="test_api_key")
-            
-            # Verify model initialization
-            mock_genai_module.GenerativeModel.assert_called_once_with("imagen-3.0-generate-001")
+            # Verify the API client was built for the configured key
+            mock_genai.Client.assert_called_once_with(api_key="test_api_key")
+            assert model.client is mock_genai.Client.return_value
             
             # Verify attributes
             assert model.api_key == "test_api_key"
@@ -84,35 +114,31 @@ class TestGeminiImageModel:
     
     def test_initialization_with_custom_params(self, mock_config, mock_genai):
         """Test initialization with custom parameters."""
-        mock_genai_module, mock_model = mock_genai
-        
         with patch('aiva_cli.models.image_model.load_config', return_value=mock_config):
             model = GeminiImageModel(api_key="custom_key", model_name="custom-model")
             
             assert model.api_key == "custom_key"
             assert model.model_name == "custom-model"
+            mock_genai.Client.assert_called_once_with(api_key="custom_key")
     
-    def test_generate_image_success(self, image_model, temp_dir):
+    def test_generate_image_success(self, image_model, tmp_path):
         """Test successful image generation."""
-        # Mock successful response with image data
-        mock_response = Mock()
-        mock_image = Mock()
-        mock_image._pil_image.save = Mock()
-        mock_response.candidates = [Mock(content=Mock(parts=[mock_image]))]
-        image_model.model.generate_content.return_value = mock_response
+        image_model.client.models.generate_images.return_value = _image_response()
         
-        output_path = temp_dir / "test_image.png"
+        output_path = tmp_path / "test_image.png"
         
-        with patch('builtins.open', mock_open()) as mock_file:
-            result = image_model.generate_image("A beautiful sunset", output_path)
+        result = image_model.generate_image("A beautiful sunset", output_path)
         
         assert result == output_path
-        image_model.model.generate_content.assert_called_once()
-        mock_image._pil_image.save.assert_called_once_with(output_path, format='PNG')
+        image_model.client.models.generate_images.assert_called_once()
+        assert image_model.client.models.generate_images.call_args.kwargs['prompt'] == "A beautiful sunset"
+        assert output_path.read_bytes().startswith(b"\x89PNG")
+        # The temporary file used for the atomic write is gone
+        assert not output_path.with_suffix(".png.tmp").exists()
     
-    def test_generate_image_empty_prompt(self, image_model, temp_dir):
+    def test_generate_image_empty_prompt(self, image_model, tmp_path):
         """Test image generation with empty prompt."""
-        output_path = temp_dir / "test_image.png"
+        output_path = tmp_path / "test_image.png"
         
         with pytest.raises(ValueError, match="Prompt cannot be empty"):
             image_model.generate_image("", output_path)
@@ -120,156 +146,152 @@ class TestGeminiImageModel:
         with pytest.raises(ValueError, match="Prompt cannot be empty"):
             image_model.generate_image("   ", output_path)
     
-    def test_generate_image_invalid_path(self, image_model):
-        """Test image generation with invalid output path."""
-        invalid_path = Path("/nonexistent/directory/image.png")
+    def test_generate_image_creates_parent_dirs(self, image_model, tmp_path):
+        """Test that missing parent directories of the output path are created."""
+        image_model.client.models.generate_images.return_value = _image_response()
+        output_path = tmp_path / "nested" / "segment_01" / "image.png"
         
-        with pytest.raises(ValueError, match="Output directory does not exist"):
-            image_model.generate_image("Test prompt", invalid_path)
+        assert image_model.generate_image("Test prompt", output_path) == output_path
+        assert output_path.is_file()
     
-    def test_generate_image_auto_filename(self, image_model, temp_dir):
-        """Test image generation with automatic filename generation."""
-        mock_response = Mock()
-        mock_image = Mock()
-        mock_image._pil_image.save = Mock()
-        mock_response.candidates = [Mock(content=Mock(parts=[mock_image]))]
-        image_model.model.generate_content.return_value = mock_response
-        
-        with patch('builtins.open', mock_open()):
-            with patch('aiva_cli.models.image_model.datetime') as mock_datetime:
-                mock_datetime.now.return_value.strftime.return_value = "20240101_120000"
-                
-                result = image_model.generate_image("Test prompt", temp_dir)
-        
-        expected_path = temp_dir / "generated_image_20240101_120000.png"
+    def test_generate_image_auto_extension(self, image_model, tmp_path):
+        """Test that an output path without a suffix gets the configured format's extension."""
+        image_model.client.models.generate_images.return_value = _image_response()
+        
+        result = image_model.generate_image("Test prompt", tmp_path / "frame")
+        
+        expected_path = tmp_path / "frame.png"
         assert result == expected_path
+        assert expected_path.is_file()
     
-    def test_generate_image_no_image_in_response(self, image_model, temp_dir):
+    def test_generate_image_no_image_in_response(self, image_model, tmp_path):
         """Test handling of response without image data."""
-        mock_response = Mock()
-        mock_response.candidates = [Mock(content=Mock(parts=[]))]
-        image_model.model.generate_content.return_value = mock_response
+        image_model.client.models.generate_images.return_value = SimpleNamespace(generated_images=[])
         
-        output_path = temp_dir / "test_image.png"
+        output_path = tmp_path / "test_image.png"
+        
+        with patch('time.sleep'):
+            with pytest.raises(RuntimeError, match="No images generated"):
+                image_model.generate_image("Test prompt", output_path)
         
-        with pytest.raises(RuntimeError, match="No image found in API response"):
-            image_model.generate_image("Test prompt", output_path)
+        assert not output_path.exists()
     
-    def test_generate_image_retry_logic(self, image_model, temp_dir):
+    def test_generate_image_retry_logic(self, image_model, tmp_path):
         """Test retry logic on API failures."""
         # Mock failures for first two attempts, success on third
-        mock_success_response = Mock()
-        mock_image = Mock()
-        mock_image._pil_image.save = Mock()
-        mock_success_response.candidates = [Mock(content=Mock(parts=[mock_image]))]
-        
-        image_model.model.generate_content.side_effect = [
+        image_model.client.models.generate_images.side_effect = [
             Exception("API Error 1"),
             Exception("API Error 2"),
-            mock_success_response
+            _image_response()
         ]
         
-        output_path = temp_dir / "test_image.png"
+        output_path = tmp_path / "test_image.png"
         
         with patch('time.sleep') as mock_sleep:
-            with patch('builtins.open', mock_open()):
-                result = image_model.generate_image("Test prompt", output_path)
+            result = image_model.generate_image("Test prompt", output_path)
         
         assert result == output_path
-        assert image_model.model.generate_content.call_count == 3
+        assert image_model.client.models.generate_images.call_count == 3
         assert mock_sleep.call_count == 2  # Sleep called between retries
     
-    def test_generate_image_max_retries_exceeded(self, image_model, temp_dir):
+    def test_generate_image_max_retries_exceeded(self, image_model, tmp_path):
         """Test behavior when max retries are exceeded."""
         # Mock failures for all attempts
-        image_model.model.generate_content.side_effect = Exception("Persistent API Error")
+        image_model.client.models.generate_images.side_effect = Exception("Persistent API Error")
         
-        output_path = temp_dir / "test_image.png"
+        output_path = tmp_path / "test_image.png"
         
         with patch('time.sleep'):
             with pytest.raises(RuntimeError, match="Image generation failed after 3 attempts"):
                 image_model.generate_image("Test prompt", output_path)
         
-        assert image_model.model.generate_content.call_count == 3
+        assert image_model.client.models.generate_images.call_count == 3
     
-    def test_generate_multiple_images_success(self, image_model, temp_dir):
+    def test_generate_multiple_images_success(self, image_model, tmp_path):
         """Test successful generation of multiple images."""
         # Mock successful responses
-        mock_image = Mock()
-        mock_image._pil_image.save = Mock()
-        mock_response = Mock()
-        mock_response.candidates = [Mock(content=Mock(parts=[mock_image]))]
-        image_model.model.generate_content.return_value = mock_response
+        image_model.client.models.generate_images.return_value = _image_response()
         
         prompts = ["Sunset", "Mountain", "Ocean"]
         
-        with patch('builtins.open', mock_open()):
-            with patch('aiva_cli.models.image_model.datetime') as mock_datetime:
-                mock_datetime.now.return_value.strftime.side_effect = [
-                    "20240101_120001", "20240101_120002", "20240101_120003"
-                ]
-                
-                results = image_model.generate_multiple_images(prompts, temp_dir)
+        results = image_model.generate_multiple_images(prompts, tmp_path)
         
         assert len(results) == 3
-        assert image_model.model.generate_content.call_count == 3
+        assert image_model.client.models.generate_images.call_count == 3
         
-        # Verify all expected paths are returned
+        # Images are numbered by their position in the prompt list
         expected_paths = [
-            temp_dir / "generated_image_20240101_120001.png",
-            temp_dir / "generated_image_20240101_120002.png",
-            temp_dir / "generated_image_20240101_120003.png"
+            tmp_path / "image_001.png",
+            tmp_path / "image_002.png",
+            tmp_path / "image_003.png"
         ]
         assert results == expected_paths
+        assert all(path.is_file() for path in expected_paths)
     
-    def test_generate_multiple_images_partial_failure(self, image_model, temp_dir):
+    def test_generate_multiple_images_partial_failure(self, image_model, tmp_path):
         """Test multiple image generation with some failures."""
-        mock_image = Mock()
-        mock_image._pil_image.save = Mock()
-        mock_success_response = Mock()
-        mock_success_response.candidates = [Mock(content=Mock(parts=[mock_image]))]
+        mock_success_response = _image_response()
         
-        # First succeeds, second fails, third succeeds
-        image_model.model.generate_content.side_effect = [
+        # First succeeds, second fails on every retry, third succeeds
+        image_model.client.models.generate_images.side_effect = [
             mock_success_response,
             Exception("API Error"),
+            Exception("API Error"),
+            Exception("API Error"),
             mock_success_response
         ]
         
         prompts = ["Sunset", "Mountain", "Ocean"]
         
-        with patch('builtins.open', mock_open()):
-            with patch('aiva_cli.models.image_model.datetime') as mock_datetime:
-                mock_datetime.now.return_value.strftime.side_effect = [
-                    "20240101_120001", "20240101_120003"
-                ]
-                with patch('time.sleep'):
-                    results = image_model.generate_multiple_images(prompts, temp_dir)
+        with patch('time.sleep'):
+            results = image_model.generate_multiple_images(prompts, tmp_path)
         
-        # Should return 2 successful results
-        assert len(results) == 2
+        # The failed prompt keeps its number, so later images are not renumbered
+        assert results == [tmp_path / "image_001.png", tmp_path / "image_003.png"]
+        assert not (tmp_path / "image_002.png").exists()
+    
+    def test_open_circuit_rejects_before_side_effects(self, image_model, tmp_path):
+        """Test that an open circuit fails before creating the output directory."""
+        image_model._breaker.failure_count = image_model._breaker.threshold - 1
+        image_model._breaker.record_failure()
+        output_dir = tmp_path / "new_dir"
+        
+        with pytest.raises(RuntimeError, match="circuit is open"):
+            image_model.generate_image("Test prompt", output_dir / "image.png")
+        
+        assert not output_dir.exists()
+        image_model.client.models.generate_images.assert_not_called()
     
     def test_calculate_backoff(self, image_model):
-        """Test exponential backoff calculation."""
-        assert image_model._calculate_backoff(0) == 1.0
-        assert image_model._calculate_backoff(1) == 2.0
-        assert image_model._calculate_backoff(2) == 4.0
-        assert image_model._calculate_backoff(10) == 60.0  # Max delay
+        """Test jittered exponential backoff calculation."""
+        for attempt in range(10):
+            delay = image_model._calculate_backoff(attempt)
+            assert 0.0 <= delay <= min(2.0 * (2 ** attempt), 120.0)
+    
+    @pytest.mark.parametrize("attempt,expected", [
+        (1, 4.0),
+        (10, 120.0),  # Max delay
+    ])
+    def test_calculate_backoff_upper_bound(self, image_model, attempt, expected):
+        """Test the backoff ceiling when the jitter draws its maximum."""
+        with patch('random.uniform', side_effect=lambda low, high: high):
+            assert image_model._calculate_backoff(attempt) == expected
     
-    def test_validate_connection_success(self, image_model, temp_dir):
+    def test_calculate_backoff_honors_retry_after(self, image_model):
+        """Test that a Retry-After hint raises the delay but stays capped."""
+        with patch('random.uniform', return_value=0.0):
+            assert image_model._calculate_backoff(0, retry_after=5.0) == 5.0
+            assert image_model._calculate_backoff(0, retry_after=10_000.0) == 120.0
+    
+    def test_validate_connection_success(self, image_model):
         """Test successful connection validation."""
-        mock_response = Mock()
-        mock_image = Mock()
-        mock_image._pil_image.save = Mock()
-        mock_response.candidates = [Mock(content=Mock(parts=[mock_image]))]
-        image_model.model.generate_content.return_value = mock_response
-        
-        with patch('builtins.open', mock_open()):
-            assert image_model.validate_connection() is True
+        image_model.client.models.generate_images.return_value = _image_response()
+        
+        assert image_model.validate_connection() is True
     
     def test_validate_connection_failure(self, image_model):
         """Test connection validation failure."""
-        image_model.model.generate_content.side_effect = Exception("Connection failed")
+        image_model.client.models.generate_images.side_effect = Exception("Connection failed")
         
         assert image_model.validate_connection() is False
     
@@ -277,12 +299,13 @@ class TestGeminiImageModel:
         """Test model information retrieval."""
         info = image_model.get_model_info()
         
-        expected_keys = ['model_name', 'timeout', 'max_retries']
+        expected_keys = ['model_name', 'timeout', 'max_retries', 'image_format']
         for key in expected_keys:
             assert key in info
         
         assert info['model_name'] == "imagen-3.0-generate-001"
         assert info['max_retries'] == 3
+        assert info['image_format'] == "png"
 
 
 class TestConvenienceFunction:
@@ -306,39 +329,41 @@ class TestErrorHandling:
     """Test cases for error handling scenarios."""
     
     def test_import_error_handling(self):
-        """Test handling of missing google-generativeai package."""
-        with patch.dict('sys.modules', {'google.generativeai': None}):
-            with pytest.raises(ImportError, match="google-generativeai package is required"):
-                # This would normally trigger the import error
-                import importlib
-                importlib.reload(__import__('aiva_cli.models.image_model', fromlist=['']))
+        """Test the import guard's detection of a missing google-genai package."""
+        # Exercise the guard directly; reloading the whole module is slow
+        # and the SDK is already mocked in sys.modules for this test run
+        with patch.dict('sys.modules', {'google.genai': None}):
+            assert not sdk_installed('google.genai')
+        assert "google-genai package is required" in _GENAI_IMPORT_ERROR
     
+    @patch('aiva_cli.models.image_model.types')
     @patch('aiva_cli.models.image_model.load_config')
     @patch('aiva_cli.models.image_model.genai')
-    def test_model_initialization_failure(self, mock_genai, mock_load_config):
-        """Test handling of model initialization failure."""
-        mock_config = Mock()
-        mock_config.gemini_api_key = "test_key"
+    def test_model_initialization_failure(self, mock_genai, mock_load_config, mock_types):
+        """Test handling of API client initialization failure."""
+        mock_config = _image_config()
         mock_config.models.image_model = "invalid-model"
         mock_load_config.return_value = mock_config
         
-        mock_genai.GenerativeModel.side_effect = Exception("Model not found")
+        mock_genai.Client.side_effect = Exception("Client init failed")
+        reset_shared_clients()
         
-        with pytest.raises(Exception, match="Model not found"):
-            GeminiImageModel()
+        with pytest.raises(Exception, match="Client init failed"):
+            GeminiImageModel(api_key="test_key")
     
-    def test_file_save_error(self, image_model, temp_dir):
+    def test_file_save_error(self, image_model, tmp_path):
         """Test handling of file save errors."""
-        mock_response = Mock()
-        mock_image = Mock()
-        mock_image._pil_image.save.side_effect = Exception("Save failed")
-        mock_response.candidates = [Mock(content=Mock(parts=[mock_image]))]
-        image_model.model.generate_content.return_value = mock_response
+        image_model.client.models.generate_images.return_value = _image_response()
         
-        output_path = temp_dir / "test_image.png"
+        output_path = tmp_path / "test_image.png"
+        
+        with patch('aiva_cli.models.image_model.os.replace', side_effect=OSError("Disk full")), \
+             patch('time.sleep'):
+            with pytest.raises(RuntimeError, match="Disk full"):
+                image_model.generate_image("Test prompt", output_path)
         
-        with pytest.raises(RuntimeError, match="Failed to save image"):
-            image_model.generate_image("Test prompt", output_path)
+        # Neither the image nor its temporary file is left behind
+        assert list(tmp_path.iterdir()) == []
 
 
 if __name__ == "__main__":
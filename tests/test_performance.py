@@ -20,7 +20,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / 'aiva_cli'))
 
 from core.pipeline import generate_content
 from models.text_model import generate_text
-from models.image_model import generate_image
+from models.image_model import generate_image, reset_shared_clients
 
 
 class TestPerformance:
@@ -173,6 +173,8 @@ class TestPerformance:
     def test_image_model_performance(self, mock_config):
         """Test image model performance characteristics."""
         with patch('models.image_model.genai') as mock_genai:
+            reset_shared_clients()
+            
             # Mock model with timing
             mock_model = Mock()
             mock_genai.GenerativeModel.return_value = mock_model
@@ -6,22 +6,12 @@ Tests the GeminiTextModel class with mocked HTTP requests to ensure
 proper functionality without making actual API calls.
 """
 
+import asyncio
 import pytest
-import sys
 import time
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from pathlib import Path
 
-# Mock the google.generativeai module before any imports
-mock_genai = MagicMock()
-sys.modules['google.generativeai'] = mock_genai
-sys.modules['google'] = MagicMock()
-sys.modules['google.generativeai'] = mock_genai
-
-# Add the aiva_cli directory to the path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'aiva_cli'))
-
-# Now we can safely import our modules
 from models.text_model import GeminiTextModel, generate_text
 
 
@@ -38,6 +28,8 @@ class TestGeminiTextModel:
         config.models.max_tokens = 2048
         config.models.timeout = 30
         config.max_retries = 3
+        config.circuit_breaker_threshold = 5
+        config.circuit_breaker_cooldown = 30.0
         return config
     
     @pytest.fixture
@@ -106,6 +98,15 @@ class TestGeminiTextModel:
         with pytest.raises(ValueError, match="Prompt cannot be empty"):
             text_model.generate_text("   ")
     
+    def test_generate_text_prompt_too_long(self, text_model):
+        """Test that over-long prompts are rejected before any API call."""
+        text_model.max_prompt_tokens = 10
+        
+        with pytest.raises(ValueError, match="Prompt too long"):
+            text_model.generate_text("x" * 100)
+        
+        text_model.model.generate_content.assert_not_called()
+    
     def test_generate_text_with_custom_params(self, text_model):
         """Test text generation with custom parameters."""
         mock_response = Mock()
@@ -162,12 +163,59 @@ class TestGeminiTextModel:
         
         assert text_model.model.generate_content.call_count == 3
     
+    def test_circuit_breaker_opens_after_threshold(self, text_model):
+        """Test that repeated failures open the circuit and skip API calls."""
+        text_model._breaker.threshold = 2
+        text_model.model.generate_content.side_effect = Exception("API down")
+        
+        with patch('time.sleep'):
+            for _ in range(2):
+                with pytest.raises(RuntimeError, match="failed after 3 attempts"):
+                    text_model.generate_text("Test prompt")
+            
+            with pytest.raises(RuntimeError, match="circuit is open"):
+                text_model.generate_text("Test prompt")
+        
+        # The open circuit short-circuits without touching the API
+        assert text_model.model.generate_content.call_count == 6
+    
+    def test_circuit_breaker_resets_on_success(self, text_model):
+        """Test that a successful call resets the failure count."""
+        text_model._breaker.failure_count = 4
+        text_model.model.generate_content.return_value = Mock(text="Recovered")
+        
+        assert text_model.generate_text("Test prompt") == "Recovered"
+        assert text_model._breaker.failure_count == 0
+    
+    def test_agenerate_text_retry_logic(self, text_model):
+        """Test async generation retries and awaits the backoff."""
+        text_model.model.generate_content_async = AsyncMock(side_effect=[
+            Exception("API Error"),
+            Mock(text="  Async response  ")
+        ])
+        
+        with patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            result = asyncio.run(text_model.agenerate_text("Test prompt"))
+        
+        assert result == "Async response"
+        assert text_model.model.generate_content_async.await_count == 2
+        mock_sleep.assert_awaited_once()
+    
     def test_calculate_backoff(self, text_model):
-        """Test exponential backoff calculation."""
-        assert text_model._calculate_backoff(0) == 1.0
-        assert text_model._calculate_backoff(1) == 2.0
-        assert text_model._calculate_backoff(2) == 4.0
-        assert text_model._calculate_backoff(10) == 60.0  # Max delay
+        """Test jittered exponential backoff calculation."""
+        for attempt in range(10):
+            delay = text_model._calculate_backoff(attempt)
+            assert 0.0 <= delay <= min(1.0 * (2 ** attempt), 60.0)
+        
+        with patch('random.uniform', side_effect=lambda low, high: high):
+            assert text_model._calculate_backoff(1) == 2.0
+            assert text_model._calculate_backoff(10) == 60.0  # Max delay
+    
+    def test_calculate_backoff_honors_retry_after(self, text_model):
+        """Test that a Retry-After hint raises the delay but stays capped."""
+        with patch('random.uniform', return_value=0.0):
+            assert text_model._calculate_backoff(0, retry_after=5.0) == 5.0
+            assert text_model._calculate_backoff(0, retry_after=10_000.0) == 60.0
     
     def test_validate_connection_success(self, text_model):
         """Test successful connection validation."""